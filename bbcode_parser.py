@@ -1,177 +1,349 @@
-import html
+import bisect
 import re
 
+# Same escapes as html.escape(quote=True), applied in a single str.translate pass.
+_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
 
-class BBCodeParser:
-    """A simple BBCode to HTML parser for Steam Workshop descriptions."""
+# Descriptions beyond these limits are rendered as escaped preformatted text instead of being tokenized,
+# so a huge or bracket-stuffed description cannot stall the UI.
+MAX_PARSE_LENGTH = 200_000
+MAX_PARSE_BRACKETS = 2000
+
+# Matches any opening or closing tag: group 1 is '/' for closing tags, group 2 the tag name, group 3 the attribute.
+# The attribute is [^\]]* and the name \w+, so the scanner never backtracks past the closing ']' of a candidate tag.
+_TAG_RE = re.compile(r'\[(/?)(\*|\w+)(?:=([^\]]*))?\]')
+
+_CODE_STYLE = 'background: #f0f0f0; padding: 10px; border-radius: 4px; overflow-x: auto; border: 1px solid #ddd;'
+_QUOTE_STYLE = 'border-left: 4px solid #ccc; margin: 10px 0; padding: 10px; background: #f9f9f9; border-radius: 4px;'
+_SPOILER_OPEN = ('<details style="margin: 5px 0;"><summary style="cursor: pointer; padding: 5px; background: #f0f0f0; '
+                 'border-radius: 4px;">')
+_SPOILER_BODY = '</summary><div style="padding: 10px; border: 1px solid #ddd; margin-top: 5px; border-radius: 4px;">'
+
+_ORDERED_LIST_STYLES = {'1': '', 'a': ' style="list-style-type: lower-alpha;"',
+                        'A': ' style="list-style-type: upper-alpha;"', 'i': ' style="list-style-type: lower-roman;"',
+                        'I': ' style="list-style-type: upper-roman;"'}
+
+
+def _escape(text):
+    """HTML-escape a run of description text and turn its line breaks into <br>."""
+    return text.translate(_ESCAPE_TABLE).replace('\r\n', '<br>').replace('\n', '<br>')
+
+
+def _size_prefix(size):
+    """Build the opening span for a BBCode size, mapped to an approximate CSS font-size."""
+    css_size = max(0.6, min(2.0, size / 5.0))
+    return f'<span style="font-size: {css_size}em;">'
+
+
+# Opening spans for the size values Steam descriptions actually use.
+_SIZE_PREFIX = {str(n): _size_prefix(n) for n in range(1, 11)}
+# Decimal digits only (isdigit() also accepts e.g. '²', which int() rejects); longer values are not sizes.
+_SIZE_ATTR_RE = re.compile(r'\d{1,3}')
+
+
+def _convert_size(attr, body):
+    """Convert BBCode size to approximate CSS font-size."""
+    if not _SIZE_ATTR_RE.fullmatch(attr):
+        return None
+    prefix = _SIZE_PREFIX.get(attr) or _size_prefix(int(attr))
+    return prefix + body + '</span>'
+
+
+def _convert_ordered_list(attr, body):
+    """Convert [list=1|a|A|i|I] to an ordered list with the matching numbering style."""
+    style = _ORDERED_LIST_STYLES.get(attr)
+    if style is None:
+        return None
+    return f'<ol{style}>{body}</ol>'
+
+
+def _convert_sized_img(attr, body):
+    """Convert [img=WxH] to an image with explicit dimensions."""
+    width, sep, height = attr.lower().partition('x')
+    if not sep:
+        return None
+    return f'<img src="{body}" width="{width}" height="{height}" style="max-width: 100%; height: auto;" alt="Image">'
+
+
+# tag -> (template without attribute, template with attribute). Templates are format strings over {attr} and {body},
+# or callables returning None when the attribute is invalid; a None entry means that form is not a recognised tag.
+TAGS = {
+    'h1': ('<h1>{body}</h1>', None), 'h2': ('<h2>{body}</h2>', None), 'h3': ('<h3>{body}</h3>', None),
+    'h4': ('<h4>{body}</h4>', None), 'h5': ('<h5>{body}</h5>', None), 'h6': ('<h6>{body}</h6>', None),
+
+    'b': ('<strong>{body}</strong>', None), 'i': ('<em>{body}</em>', None),
+    'u': ('<u>{body}</u>', None), 's': ('<s>{body}</s>', None),
+    'sup': ('<sup>{body}</sup>', None), 'sub': ('<sub>{body}</sub>', None),
 
-    def __init__(self):
+    'center': ('<div style="text-align: center;">{body}</div>', None),
+    'left': ('<div style="text-align: left;">{body}</div>', None),
+    'right': ('<div style="text-align: right;">{body}</div>', None),
+    'justify': ('<div style="text-align: justify;">{body}</div>', None),
 
-        self.patterns = [
-            (r'\[h1\](.*?)\[/h1\]', r'<h1>\1</h1>'), (r'\[h2\](.*?)\[/h2\]', r'<h2>\1</h2>'),
-            (r'\[h3\](.*?)\[/h3\]', r'<h3>\1</h3>'), (r'\[h4\](.*?)\[/h4\]', r'<h4>\1</h4>'),
-            (r'\[h5\](.*?)\[/h5\]', r'<h5>\1</h5>'), (r'\[h6\](.*?)\[/h6\]', r'<h6>\1</h6>'),
+    'url': ('<a href="{body}" target="_blank">{body}</a>', '<a href="{attr}" target="_blank">{body}</a>'),
+    'img': ('<img src="{body}" style="max-width: 100%; height: auto;" alt="Image">', _convert_sized_img),
 
-            (r'\[hr\]', r'<hr>'),
+    'code': (f'<pre style="{_CODE_STYLE}"><code>{{body}}</code></pre>',
+             f'<pre style="{_CODE_STYLE}"><code class="language-{{attr}}">{{body}}</code></pre>'),
+    'c': ('<code style="background: #f0f0f0; padding: 2px 4px; border-radius: 2px; border: 1px solid #ddd;">{body}</code>',
+          None),
 
-            (r'\[b\](.*?)\[/b\]', r'<strong>\1</strong>'), (r'\[i\](.*?)\[/i\]', r'<em>\1</em>'),
-            (r'\[u\](.*?)\[/u\]', r'<u>\1</u>'), (r'\[s\](.*?)\[/s\]', r'<s>\1</s>'),
-            (r'\[sup\](.*?)\[/sup\]', r'<sup>\1</sup>'), (r'\[sub\](.*?)\[/sub\]', r'<sub>\1</sub>'),
+    'list': ('<ul>{body}</ul>', _convert_ordered_list), 'ul': ('<ul>{body}</ul>', None),
+    'ol': ('<ol>{body}</ol>', None), 'li': ('<li>{body}</li>', None), '*': ('<li>{body}</li>', None),
 
-            (r'\[center\](.*?)\[/center\]', r'<div style="text-align: center;">\1</div>'),
-            (r'\[left\](.*?)\[/left\]', r'<div style="text-align: left;">\1</div>'),
-            (r'\[right\](.*?)\[/right\]', r'<div style="text-align: right;">\1</div>'),
-            (r'\[justify\](.*?)\[/justify\]', r'<div style="text-align: justify;">\1</div>'),
+    'table': ('<table style="border-collapse: collapse; width: 100%;">{body}</table>', None),
+    'tr': ('<tr>{body}</tr>', None),
+    'td': ('<td style="border: 1px solid #ddd; padding: 8px;">{body}</td>', None),
+    'th': ('<th style="border: 1px solid #ddd; padding: 8px; background-color: #f2f2f2; font-weight: bold;">{body}</th>',
+           None),
 
-            (r'\[url=(.*?)\](.*?)\[/url\]', r'<a href="\1" target="_blank">\2</a>'),
-            (r'\[url\](.*?)\[/url\]', r'<a href="\1" target="_blank">\1</a>'),
+    'quote': (f'<blockquote style="{_QUOTE_STYLE}">{{body}}</blockquote>',
+              f'<blockquote style="{_QUOTE_STYLE}"><strong>{{attr}} said:</strong><br>{{body}}</blockquote>'),
+    'spoiler': (f'{_SPOILER_OPEN}Spoiler{_SPOILER_BODY}{{body}}</div></details>',
+                f'{_SPOILER_OPEN}{{attr}}{_SPOILER_BODY}{{body}}</div></details>'),
 
-            (r'\[img\](.*?)\[/img\]', r'<img src="\1" style="max-width: 100%; height: auto;" alt="Image">'),
-            (r'\[img=(.*?)x(.*?)\](.*?)\[/img\]',
-             r'<img src="\3" width="\1" height="\2" style="max-width: 100%; height: auto;" alt="Image">'),
+    'size': (None, _convert_size),
+    'color': (None, '<span style="color: {attr};">{body}</span>'),
+    'font': (None, '<span style="font-family: {attr};">{body}</span>'),
 
-            (r'\[code\](.*?)\[/code\]',
-             r'<pre style="background: #f0f0f0; padding: 10px; border-radius: 4px; overflow-x: auto; border: 1px solid #ddd;"><code>\1</code></pre>'),
-            (r'\[code=(.*?)\](.*?)\[/code\]',
-             r'<pre style="background: #f0f0f0; padding: 10px; border-radius: 4px; overflow-x: auto; border: 1px solid #ddd;"><code class="language-\1">\2</code></pre>'),
+    'youtube': ('<iframe width="560" height="315" src="https://www.youtube.com/embed/{body}" frameborder="0" '
+                'allowfullscreen></iframe>', None),
+    'video': ('<video controls style="max-width: 100%;"><source src="{body}" type="video/mp4">'
+              'Your browser does not support the video tag.</video>', None),
+    'audio': ('<audio controls><source src="{body}" type="audio/mpeg">'
+              'Your browser does not support the audio element.</audio>', None),
 
-            (r'\[c\](.*?)\[/c\]',
-             r'<code style="background: #f0f0f0; padding: 2px 4px; border-radius: 2px; border: 1px solid #ddd;">\1</code>'),
+    'email': ('<a href="mailto:{body}">{body}</a>', '<a href="mailto:{attr}">{body}</a>'),
+}
 
-            (r'\[list\](.*?)\[/list\]', r'<ul>\1</ul>'), (r'\[ul\](.*?)\[/ul\]', r'<ul>\1</ul>'),
-            (r'\[list=1\](.*?)\[/list\]', r'<ol>\1</ol>'), (r'\[ol\](.*?)\[/ol\]', r'<ol>\1</ol>'),
-            (r'\[list=a\](.*?)\[/list\]', r'<ol style="list-style-type: lower-alpha;">\1</ol>'),
-            (r'\[list=A\](.*?)\[/list\]', r'<ol style="list-style-type: upper-alpha;">\1</ol>'),
-            (r'\[list=i\](.*?)\[/list\]', r'<ol style="list-style-type: lower-roman;">\1</ol>'),
-            (r'\[list=I\](.*?)\[/list\]', r'<ol style="list-style-type: upper-roman;">\1</ol>'),
+# Tags whose body is taken literally up to the matching closing tag (code, or a URL/source) rather than parsed.
+_VERBATIM_TAGS = frozenset(('code', 'img', 'youtube', 'video', 'audio'))
+_VERBATIM_WITHOUT_ATTR = frozenset(('url', 'email'))
+_VERBATIM_CLOSE = {tag: re.compile(re.escape(f'[/{tag}]'), re.IGNORECASE)
+                   for tag in _VERBATIM_TAGS | _VERBATIM_WITHOUT_ATTR}
 
-            (r'\[\*\](.*?)(?=\[\*\]|\[/(?:list|ul|ol)\])', r'<li>\1</li>'), (r'\[li\](.*?)\[/li\]', r'<li>\1</li>'),
+_LIST_TAGS = frozenset(('list', 'ul', 'ol'))
 
-            (r'\[table\](.*?)\[/table\]', r'<table style="border-collapse: collapse; width: 100%;">\1</table>'),
-            (r'\[tr\](.*?)\[/tr\]', r'<tr>\1</tr>'),
-            (r'\[td\](.*?)\[/td\]', r'<td style="border: 1px solid #ddd; padding: 8px;">\1</td>'),
-            (r'\[th\](.*?)\[/th\]',
-             r'<th style="border: 1px solid #ddd; padding: 8px; background-color: #f2f2f2; font-weight: bold;">\1</th>'),
 
-            (r'\[quote\](.*?)\[/quote\]',
-             r'<blockquote style="border-left: 4px solid #ccc; margin: 10px 0; padding: 10px; background: #f9f9f9; border-radius: 4px;">\1</blockquote>'),
-            (r'\[quote=(.*?)\](.*?)\[/quote\]',
-             r'<blockquote style="border-left: 4px solid #ccc; margin: 10px 0; padding: 10px; background: #f9f9f9; border-radius: 4px;"><strong>\1 said:</strong><br>\2</blockquote>'),
+def _render(tag, attr, body):
+    """Render one element from its raw attribute and already-converted body, or None if it is not recognised."""
+    templates = TAGS.get(tag)
+    if templates is None:
+        return None
+    template = templates[0] if attr is None else templates[1]
+    if template is None:
+        return None
+    if attr is not None:
+        attr = attr.translate(_ESCAPE_TABLE)
+    if callable(template):
+        return template(attr, body)
+    return template.format(attr=attr, body=body)
 
-            (r'\[spoiler\](.*?)\[/spoiler\]',
-             r'<details style="margin: 5px 0;"><summary style="cursor: pointer; padding: 5px; background: #f0f0f0; border-radius: 4px;">Spoiler</summary><div style="padding: 10px; border: 1px solid #ddd; margin-top: 5px; border-radius: 4px;">\1</div></details>'),
-            (r'\[spoiler=(.*?)\](.*?)\[/spoiler\]',
-             r'<details style="margin: 5px 0;"><summary style="cursor: pointer; padding: 5px; background: #f0f0f0; border-radius: 4px;">\1</summary><div style="padding: 10px; border: 1px solid #ddd; margin-top: 5px; border-radius: 4px;">\2</div></details>'),
 
-            (r'\[size=(\d+)\](.*?)\[/size\]', self._convert_size),
-            (r'\[color=(.*?)\](.*?)\[/color\]', r'<span style="color: \1;">\2</span>'),
-            (r'\[font=(.*?)\](.*?)\[/font\]', r'<span style="font-family: \1;">\2</span>'),
+def _close_frame(frame):
+    """Render a frame whose closing tag was found; falls back to the literal markup if it does not render."""
+    tag, attr, open_text, parts = frame
+    body = ''.join(parts)
+    rendered = _render(tag, attr, body)
+    if rendered is None:
+        return open_text + body + f'[/{tag}]'
+    return rendered
 
-            (r'\[youtube\](.*?)\[/youtube\]',
-             r'<iframe width="560" height="315" src="https://www.youtube.com/embed/\1" frameborder="0" allowfullscreen></iframe>'),
-            (r'\[video\](.*?)\[/video\]',
-             r'<video controls style="max-width: 100%;"><source src="\1" type="video/mp4">Your browser does not support the video tag.</video>'),
-            (r'\[audio\](.*?)\[/audio\]',
-             r'<audio controls><source src="\1" type="audio/mpeg">Your browser does not support the audio element.</audio>'),
 
-            (r'\[email\](.*?)\[/email\]', r'<a href="mailto:\1">\1</a>'),
-            (r'\[email=(.*?)\](.*?)\[/email\]', r'<a href="mailto:\1">\2</a>'),
+def _abandon_frame(frame):
+    """Flatten a frame that was never closed: list items close implicitly, anything else stays literal."""
+    tag, attr, open_text, parts = frame
+    body = ''.join(parts)
+    if tag == '*' and attr is None:
+        return _render(tag, attr, body)
+    return open_text + body
 
-            (r'\[url=https://steamcommunity\.com/profiles/(\d+)\](.*?)\[/url\]',
-             r'<a href="https://steamcommunity.com/profiles/\1" target="_blank">\2</a>'),
-            (r'\[url=https://steamcommunity\.com/sharedfiles/filedetails/\?id=(\d+)\](.*?)\[/url\]',
-             r'<a href="https://steamcommunity.com/sharedfiles/filedetails/?id=\1" target="_blank">\2</a>'), ]
 
-    def _convert_size(self, match):
-        """Convert BBCode size to approximate CSS font-size."""
-        size = int(match.group(1))
+def _close_positions(text, tag, cache):
+    """Sorted start offsets of every [/tag] in text (case-insensitive), computed once per tag."""
+    positions = cache.get(tag)
+    if positions is None:
+        if 'lower' not in cache:
+            cache['lower'] = text.lower()
+        positions = cache[tag] = []
+        closing = f'[/{tag}]'
+        index = cache['lower'].find(closing)
+        while index != -1:
+            positions.append(index)
+            index = cache['lower'].find(closing, index + 1)
+    return positions
 
-        css_size = max(0.6, min(2.0, size / 5.0))
-        return f'<span style="font-size: {css_size}em;">{match.group(2)}</span>'
 
-    def parse(self, bbcode_text):
+def _convert(text):
+    """Convert BBCode to HTML in one left-to-right scan with an explicit stack of open tags.
+
+    Every text run is escaped as it is appended to the current element's fragment list, and each element's
+    fragments are joined once when it closes, so no intermediate copy of the whole description is made.
+    """
+    unclosed = set()
+    close_cache = {}
+    root = []
+    stack = []
+    pos = 0
+
+    while True:
+        match = _TAG_RE.search(text, pos)
+        parts = stack[-1][3] if stack else root
+        if match is None:
+            parts.append(_escape(text[pos:]))
+            break
+
+        parts.append(_escape(text[pos:match.start()]))
+        pos = match.end()
+        is_close, tag, attr = match.group(1), match.group(2).lower(), match.group(3)
+        raw = _escape(match.group(0))
+
+        if not is_close:
+            if tag in _VERBATIM_TAGS or (tag in _VERBATIM_WITHOUT_ATTR and attr is None):
+                close = None if tag in unclosed else _VERBATIM_CLOSE[tag].search(text, pos)
+                if close is None:
+                    unclosed.add(tag)
+                rendered = _render(tag, attr, _escape(text[pos:close.start()])) if close else None
+                if rendered is None:
+                    parts.append(raw)
+                else:
+                    parts.append(rendered)
+                    pos = close.end()
+            elif tag == 'hr' and attr is None:
+                parts.append('<hr>')
+            elif tag not in TAGS:
+                parts.append(raw)
+            else:
+                if tag == '*':
+                    for depth in range(len(stack) - 1, -1, -1):
+                        if stack[depth][0] in _LIST_TAGS:
+                            break
+                        if stack[depth][0] == '*':
+                            while len(stack) > depth:
+                                frame = stack.pop()
+                                (stack[-1][3] if stack else root).append(_abandon_frame(frame))
+                            break
+                stack.append([tag, attr, raw, []])
+            continue
+
+        depth = next((d for d in range(len(stack) - 1, -1, -1) if stack[d][0] == tag), None)
+        if depth is None:
+            parts.append(raw)
+            continue
+        # Misnested tags, e.g. [b]a [i]b[/b] c[/i]: an inner element whose own closing tag comes later is closed
+        # here and reopened after this one, like a browser repairs overlapping HTML. Without a later closing tag
+        # it stays literal, like any unclosed tag.
+        reopen = []
+        while len(stack) > depth + 1:
+            frame = stack.pop()
+            inner_tag, inner_attr, _, inner_parts = frame
+            positions = None if inner_tag == '*' else _close_positions(text, inner_tag, close_cache)
+            rendered = None
+            if positions and bisect.bisect_left(positions, pos) < len(positions):
+                rendered = _render(inner_tag, inner_attr, ''.join(inner_parts))
+            if rendered is None:
+                stack[-1][3].append(_abandon_frame(frame))
+            else:
+                stack[-1][3].append(rendered)
+                reopen.append([inner_tag, inner_attr, '', []])
+        frame = stack.pop()
+        # A reopened element that got no content before closing again leaves nothing behind.
+        if frame[2] or any(frame[3]):
+            (stack[-1][3] if stack else root).append(_close_frame(frame))
+        stack.extend(reversed(reopen))
+
+    while stack:
+        frame = stack.pop()
+        (stack[-1][3] if stack else root).append(_abandon_frame(frame))
+
+    return ''.join(root)
+
+
+HTML_PREFIX = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 10px;
+            line-height: 1.4;
+            word-wrap: break-word;
+        }
+        h1, h2, h3, h4, h5, h6 {
+            margin-top: 20px;
+            margin-bottom: 10px;
+            color: #333;
+        }
+        h1 { font-size: 2em; }
+        h2 { font-size: 1.8em; }
+        h3 { font-size: 1.6em; }
+        h4 { font-size: 1.4em; }
+        h5 { font-size: 1.2em; }
+        h6 { font-size: 1em; }
+        hr {
+            border: none;
+            border-top: 1px solid #ccc;
+            margin: 20px 0;
+        }
+        ul, ol {
+            margin: 10px 0;
+            padding-left: 30px;
+        }
+        li {
+            margin: 5px 0;
+        }
+        table {
+            margin: 10px 0;
+        }
+        a {
+            color: #0066cc;
+            text-decoration: underline;
+        }
+        a:hover {
+            text-decoration: none;
+        }
+        img {
+            max-width: 100%;
+            height: auto;
+            display: block;
+            margin: 5px 0;
+        }
+        pre {
+            white-space: pre-wrap;
+            word-wrap: break-word;
+        }
+        blockquote {
+            margin-left: 0;
+        }
+        video, audio, iframe {
+            max-width: 100%;
+            margin: 10px 0;
+        }
+    </style>
+</head>
+<body>
+"""
+
+HTML_SUFFIX = """
+</body>
+</html>
+"""
+
+
+class BBCodeParser:
+    """A simple BBCode to HTML parser for Steam Workshop descriptions."""
+
+    @staticmethod
+    def parse(bbcode_text):
         """Convert BBCode text to HTML."""
         if not bbcode_text:
             return "<p>No description available.</p>"
 
-        html_text = html.escape(bbcode_text)
+        if len(bbcode_text) > MAX_PARSE_LENGTH or bbcode_text.count('[') > MAX_PARSE_BRACKETS:
+            return HTML_PREFIX + '<pre>' + bbcode_text.translate(_ESCAPE_TABLE) + '</pre>' + HTML_SUFFIX
 
-        for pattern, replacement in self.patterns:
-            if callable(replacement):
-                html_text = re.sub(pattern, replacement, html_text, flags=re.DOTALL | re.IGNORECASE)
-            else:
-                html_text = re.sub(pattern, replacement, html_text, flags=re.DOTALL | re.IGNORECASE)
-
-        html_text = re.sub(r'\r?\n', '<br>', html_text)
-
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    margin: 10px;
-                    line-height: 1.4;
-                    word-wrap: break-word;
-                }}
-                h1, h2, h3, h4, h5, h6 {{
-                    margin-top: 20px;
-                    margin-bottom: 10px;
-                    color: #333;
-                }}
-                h1 {{ font-size: 2em; }}
-                h2 {{ font-size: 1.8em; }}
-                h3 {{ font-size: 1.6em; }}
-                h4 {{ font-size: 1.4em; }}
-                h5 {{ font-size: 1.2em; }}
-                h6 {{ font-size: 1em; }}
-                hr {{
-                    border: none;
-                    border-top: 1px solid #ccc;
-                    margin: 20px 0;
-                }}
-                ul, ol {{
-                    margin: 10px 0;
-                    padding-left: 30px;
-                }}
-                li {{
-                    margin: 5px 0;
-                }}
-                table {{
-                    margin: 10px 0;
-                }}
-                a {{
-                    color: #0066cc;
-                    text-decoration: underline;
-                }}
-                a:hover {{
-                    text-decoration: none;
-                }}
-                img {{
-                    max-width: 100%;
-                    height: auto;
-                    display: block;
-                    margin: 5px 0;
-                }}
-                pre {{
-                    white-space: pre-wrap;
-                    word-wrap: break-word;
-                }}
-                blockquote {{
-                    margin-left: 0;
-                }}
-                video, audio, iframe {{
-                    max-width: 100%;
-                    margin: 10px 0;
-                }}
-            </style>
-        </head>
-        <body>
-            {html_text}
-        </body>
-        </html>
-        """
-
-        return full_html
+        if '[' not in bbcode_text:
+            return HTML_PREFIX + _escape(bbcode_text) + HTML_SUFFIX
+
+        return HTML_PREFIX + _convert(bbcode_text) + HTML_SUFFIX
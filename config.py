@@ -1,8 +1,10 @@
 """
 Configuration file for the Steam Workshop Downloader.
 """
+import importlib.util
+import os
 
-DATA_FILE = "mods.json"
+DATA_FILE = "mods.json.gz"
 STEAMCMD_PATH = r"steamcmd/steamcmd.exe"
 
 MAIN_WINDOW_WIDTH = 700
@@ -15,12 +17,14 @@ DESCRIPTION_WINDOW_HEIGHT = 600
 
 STEAM_API_URL = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
 REQUEST_TIMEOUT = 10
+INFO_FETCH_WORKERS = 4
+HTTP_POOL_SIZE = 32
+STEAM_API_BATCH_SIZE = 100
+MOD_INFO_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "swd", "modinfo.json")
+MOD_INFO_CACHE_TTL = 24 * 60 * 60
 
 PROGRESS_UPDATE_INTERVAL = 100
+FILTER_DEBOUNCE_MS = 150
+SAVE_DEBOUNCE_SECONDS = 2.0
 
-try:
-    import tkinterweb as tkweb
-
-    TKINTERWEB_AVAILABLE = True
-except ImportError:
-    TKINTERWEB_AVAILABLE = False
+TKINTERWEB_AVAILABLE = importlib.util.find_spec("tkinterweb") is not None
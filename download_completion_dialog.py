@@ -9,6 +9,8 @@ class DownloadCompletionDialog:
         self.parent = parent
         self.result = download_result
         self.dialog = None
+        self._ids_text = ''
+        self._details_text = ''
         self._show_dialog()
 
     def _show_dialog(self):
@@ -30,17 +32,15 @@ class DownloadCompletionDialog:
             messagebox.showinfo(title, message)
             return
 
+        x = (self.parent.winfo_screenwidth() // 2) - (500 // 2)
+        y = (self.parent.winfo_screenheight() // 2) - (400 // 2)
+
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title(title)
-        self.dialog.geometry("500x400")
+        self.dialog.geometry(f"500x400+{x}+{y}")
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
 
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
-        self.dialog.geometry(f"500x400+{x}+{y}")
-
         message_label = tk.Label(self.dialog, text=message, font=("Helvetica", 10, "bold"))
         message_label.pack(pady=10)
 
@@ -55,12 +55,11 @@ class DownloadCompletionDialog:
             scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.failed_listbox.yview)
             self.failed_listbox.config(yscrollcommand=scrollbar.set)
 
-            for failed_mod in self.result['failed_details']:
-                mod_id = failed_mod['id']
-                title = failed_mod['title']
-                reason = failed_mod['reason']
-                display_text = f"{mod_id} - {title} ({reason})"
-                self.failed_listbox.insert(tk.END, display_text)
+            failed_texts = [f"{m['id']} - {m['title']} ({m['reason']})" for m in self.result['failed_details']]
+            self.failed_listbox.insert(tk.END, *failed_texts)
+
+            self._details_text = '\n'.join(failed_texts)
+            self._ids_text = '\n'.join(self.result['failed_ids'])
 
             self.failed_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -84,27 +83,14 @@ class DownloadCompletionDialog:
 
     def _copy_failed_ids(self):
         """Copy the list of failed mod IDs to clipboard."""
-        failed_ids = self.result['failed_ids']
-        if failed_ids:
-            ids_text = '\n'.join(failed_ids)
+        if self._ids_text:
             self.dialog.clipboard_clear()
-            self.dialog.clipboard_append(ids_text)
-
-            messagebox.showinfo("Copied", f"Copied {len(failed_ids)} failed mod IDs to clipboard.")
+            self.dialog.clipboard_append(self._ids_text)
+            messagebox.showinfo("Copied", f"Copied {len(self.result['failed_ids'])} failed mod IDs to clipboard.")
 
     def _copy_failed_details(self):
         """Copy the detailed list of failed mods to clipboard."""
-        failed_details = self.result['failed_details']
-        if failed_details:
-            details_lines = []
-            for failed_mod in failed_details:
-                mod_id = failed_mod['id']
-                title = failed_mod['title']
-                reason = failed_mod['reason']
-                details_lines.append(f"{mod_id} - {title} ({reason})")
-
-            details_text = '\n'.join(details_lines)
+        if self._details_text:
             self.dialog.clipboard_clear()
-            self.dialog.clipboard_append(details_text)
-
-            messagebox.showinfo("Copied", f"Copied {len(failed_details)} failed mod details to clipboard.")
+            self.dialog.clipboard_append(self._details_text)
+            messagebox.showinfo("Copied", f"Copied {len(self.result['failed_details'])} failed mod details to clipboard.")
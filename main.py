@@ -1,5 +1,8 @@
+import collections
+import os
 import queue
 import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
 
@@ -13,6 +16,77 @@ from steamcmd_downloader import SteamCMDDownloader
 from ui_components import WindowHelper, LogPopup, DescriptionPopup, ModInfoWidget
 
 
+class _Emitter:
+    """
+    Coalesces downloader progress/log/status callbacks and posts them at most once per interval:
+    only the latest progress and status survive, log lines are joined into one chunk.
+    """
+
+    def __init__(self, post, shutdown_event, interval=0.05):
+        self._post = post
+        self._shutdown_event = shutdown_event
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._timer = None
+        self._pending_progress = None
+        self._pending_status = None
+        self._pending_log = []
+
+    def progress(self, current, total):
+        if self._shutdown_event.is_set():
+            return
+        with self._lock:
+            self._pending_progress = (current, total)
+            self._arm()
+
+    def log(self, message):
+        # Nothing is posted after shutdown, so don't buffer output nobody will see.
+        if self._shutdown_event.is_set():
+            return
+        with self._lock:
+            self._pending_log.append(message)
+            self._arm()
+
+    def status(self, status):
+        if self._shutdown_event.is_set():
+            return
+        with self._lock:
+            self._pending_status = status
+            self._arm()
+
+    def _arm(self):
+        """Start the flush timer unless one is already pending. Call with _lock held."""
+        if self._timer is None:
+            self._timer = threading.Timer(self._interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Post whatever is pending, one message per channel."""
+        # Posting is a cheap append, so it happens under the lock to keep concurrent flushes in order.
+        with self._lock:
+            self._timer = None
+            progress, self._pending_progress = self._pending_progress, None
+            status, self._pending_status = self._pending_status, None
+            log_lines, self._pending_log = self._pending_log, []
+
+            if self._shutdown_event.is_set():
+                return
+            if log_lines:
+                self._post("log", "".join(log_lines))
+            if status is not None:
+                self._post("status", status)
+            if progress is not None:
+                self._post("progress", {"current": progress[0], "total": progress[1]})
+
+    def close(self):
+        """Cancel the pending timer and flush immediately, so nothing trails a later message."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+        self.flush()
+
+
 
 class SteamWorkshopDownloader:
     """Main application class for the Steam Workshop Downloader."""
@@ -32,12 +106,25 @@ class SteamWorkshopDownloader:
         self.log_popup = None
         self.listbox_to_mod_index = {}
         self.filtered_mods = []
+        self.filtered_hierarchy = []
+        self._filter_cache = {}
+        self._filter_cache_order = collections.deque(maxlen=8)
         self.current_filter = ""
         self.filter_show_dependencies = True
         self.filter_show_main_mods = True
         self.current_selection = []
-
-        self.download_queue = queue.Queue()
+        self._filter_after_id = None
+        self._suppress_select = False
+        self._listbox_rows = []
+        self._last_buttons_state = None
+        # (catalog version, mods snapshot, id -> position), rebuilt only when the catalog changes.
+        self._catalog_index = (None, [], {})
+
+        self.download_queue = collections.deque()
+        self._dirty_mod_ids = set()
+        self._queue_event = threading.Event()
+        self._queue_after_id = None
+        self._wakeup_fds = self._create_wakeup_pipe()
         self.is_downloading = False
 
         self.process_queue()
@@ -46,8 +133,19 @@ class SteamWorkshopDownloader:
 
         self.refresh_listbox()
 
-        self.active_threads = []
         self.shutdown_event = threading.Event()
+        # Pending mod ids drained by a fixed set of workers; _fetch_pending dedupes queued/in-flight ids.
+        self._fetch_queue = queue.Queue()
+        self._fetch_pending = set()
+        self._fetch_pending_lock = threading.Lock()
+        self._fetch_workers = []
+        for i in range(config.INFO_FETCH_WORKERS):
+            worker = threading.Thread(target=self._fetch_loop, name=f"info-fetch-{i}", daemon=True)
+            worker.start()
+            self._fetch_workers.append(worker)
+        # Description fetches run on the shared SteamAPI pool; at most one in flight per mod id.
+        self._inflight_desc = set()
+        self._inflight_lock = threading.Lock()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -119,6 +217,7 @@ class SteamWorkshopDownloader:
         self.mod_info_widget.set_view_description_callback(self.show_description_popup)
 
         self.status_label = tk.Label(self.root, text="", bd=1, relief=tk.SUNKEN, anchor="w")
+        self._last_status = ""
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
         self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
@@ -131,6 +230,8 @@ class SteamWorkshopDownloader:
 
     def _on_listbox_select(self, event):
         """Handle listbox selection change."""
+        if self._suppress_select:
+            return
         self.current_selection = list(self.listbox.curselection())
         self.show_mod_info(event)
 
@@ -143,48 +244,67 @@ class SteamWorkshopDownloader:
                     self.listbox.selection_set(index)
 
     def _on_filter_change(self, event=None):
-        """Called when filter text changes."""
-        self.root.after_idle(self._apply_filter)
+        """Called when filter text changes; only the last keystroke in a burst triggers a filter pass."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(config.FILTER_DEBOUNCE_MS, self._apply_filter)
 
     def _apply_filter(self):
         """Apply the current filter settings."""
-        filter_text = self.filter_entry.get().lower().strip()
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
+        filter_text = self.filter_entry.get().strip().casefold()
         show_main = self.show_main_var.get()
         show_deps = self.show_deps_var.get()
 
-        all_mods = self.mod_manager.get_all_mods()
-
-        filtered_mods = []
-        for mod in all_mods:
-            is_dependency = mod.get('is_dependency', False)
-            if is_dependency and not show_deps:
-                continue
-            if not is_dependency and not show_main:
-                continue
+        version = self.mod_manager.version
+        if self._catalog_index[0] != version:
+            all_mods = self.mod_manager.get_all_mods()
+            self._catalog_index = (version, all_mods, {m['id']: i for i, m in enumerate(all_mods)})
+        _, all_mods, id_to_index = self._catalog_index
 
-            if filter_text:
-                title = mod.get('info', {}).get('title', '').lower()
-                mod_id = mod['id'].lower()
-                url = mod['url'].lower()
+        cache_key = (filter_text, show_main, show_deps, version)
+        cached = self._filter_cache.get(cache_key)
+        if cached:
+            filtered_mods, hierarchical_list = cached
+        else:
+            filtered_mods = []
+            for mod in all_mods:
+                is_dependency = mod.get('is_dependency', False)
+                if is_dependency and not show_deps:
+                    continue
+                if not is_dependency and not show_main:
+                    continue
 
-                if (filter_text not in title and filter_text not in mod_id and filter_text not in url):
+                if filter_text and filter_text not in mod['_index'].search_blob:
                     continue
 
-            filtered_mods.append(mod)
+                filtered_mods.append(mod)
+
+            self.filtered_mods = filtered_mods
+            hierarchical_list = self._build_filtered_hierarchical_list(all_mods, id_to_index)
+
+            if len(self._filter_cache_order) == self._filter_cache_order.maxlen:
+                del self._filter_cache[self._filter_cache_order[0]]
+            self._filter_cache_order.append(cache_key)
+            self._filter_cache[cache_key] = (filtered_mods, hierarchical_list)
 
         self.filtered_mods = filtered_mods
+        self.filtered_hierarchy = hierarchical_list
         self.current_filter = filter_text
         self.filter_show_dependencies = show_deps
         self.filter_show_main_mods = show_main
 
-        total_mods = len(all_mods)
         filtered_count = len(filtered_mods)
+        total_mods = len(all_mods)
         if filtered_count == total_mods:
             self.filter_info_label.config(text=f"Showing all {total_mods} mods")
         else:
             self.filter_info_label.config(text=f"Showing {filtered_count} of {total_mods} mods")
 
-        self._refresh_filtered_listbox()
+        self._refresh_filtered_listbox(all_mods, id_to_index)
 
     def _clear_filter(self):
         """Clear all filters."""
@@ -193,24 +313,21 @@ class SteamWorkshopDownloader:
         self.show_deps_var.set(True)
         self._apply_filter()
 
-    def _refresh_filtered_listbox(self):
-        """Refresh the listbox with filtered mod data."""
+    def _refresh_filtered_listbox(self, all_mods, id_to_index):
+        """Refresh the listbox with filtered mod data, given the catalog snapshot and its id index."""
         selected_mod_ids = []
         for listbox_index in self.current_selection:
             if listbox_index in self.listbox_to_mod_index:
                 mod_index = self.listbox_to_mod_index[listbox_index]
-                all_mods = self.mod_manager.get_all_mods()
                 if 0 <= mod_index < len(all_mods):
                     selected_mod_ids.append(all_mods[mod_index]['id'])
 
-        self.listbox.delete(0, tk.END)
-
-        hierarchical_list = self._build_filtered_hierarchical_list()
+        hierarchical_list = self.filtered_hierarchy
 
         self.listbox_to_mod_index = {}
         new_selected_indices = []
+        rows = []
 
-        all_mods = self.mod_manager.get_all_mods()
         for listbox_index, (mod, indent_level) in enumerate(hierarchical_list):
             info = mod.get("info") or {}
             title = info.get("title", mod["url"])
@@ -221,56 +338,78 @@ class SteamWorkshopDownloader:
             else:
                 title = f"{indent}{title}"
 
-            self.listbox.insert(tk.END, title)
+            rows.append((mod['id'], title))
 
-            original_index = all_mods.index(mod)
-            self.listbox_to_mod_index[listbox_index] = original_index
+            self.listbox_to_mod_index[listbox_index] = id_to_index[mod['id']]
 
             if mod['id'] in selected_mod_ids:
                 new_selected_indices.append(listbox_index)
 
-        self.current_selection = new_selected_indices
-        for index in new_selected_indices:
-            self.listbox.selection_set(index)
+        self._suppress_select = True
+        try:
+            self._update_listbox_rows(rows)
+
+            self.listbox.selection_clear(0, tk.END)
+            self.current_selection = new_selected_indices
+            self._select_listbox_indices(new_selected_indices)
+        finally:
+            self._suppress_select = False
 
         if new_selected_indices:
             self.listbox.see(new_selected_indices[0])
         elif len(hierarchical_list) > 0:
             self.listbox.see(tk.END)
 
-    def _build_filtered_hierarchical_list(self):
+    def _update_listbox_rows(self, rows):
+        """Replace the listbox contents with rows, touching only the slice between the common prefix and suffix."""
+        old_rows = self._listbox_rows
+        limit = min(len(old_rows), len(rows))
+
+        prefix = 0
+        while prefix < limit and old_rows[prefix] == rows[prefix]:
+            prefix += 1
+
+        suffix = 0
+        while suffix < limit - prefix and old_rows[-1 - suffix] == rows[-1 - suffix]:
+            suffix += 1
+
+        if len(old_rows) - suffix > prefix:
+            self.listbox.delete(prefix, len(old_rows) - suffix - 1)
+
+        middle = rows[prefix:len(rows) - suffix]
+        if middle:
+            self.listbox.insert(prefix, *(title for _, title in middle))
+
+        self._listbox_rows = rows
+
+    def _build_filtered_hierarchical_list(self, all_mods, id_to_index):
         """Build a hierarchical list for filtered mods, maintaining dependency relationships."""
-        all_mods_by_id = {mod['id']: mod for mod in self.mod_manager.get_all_mods()}
         filtered_mods_ids = {mod['id'] for mod in self.filtered_mods}
 
-        root_mods = []
         dependency_mods = set()
-
         for mod in self.filtered_mods:
-            dependencies = mod.get('info', {}).get('dependencies', [])
-            dependency_mods.update(dependencies)
+            dependency_mods |= mod['_index'].dep_set
 
-        for mod in self.filtered_mods:
-            if not mod.get('is_dependency', False):
-                root_mods.append(mod)
-            elif mod['id'] not in dependency_mods:
-                root_mods.append(mod)
+        root_mods = [mod for mod in self.filtered_mods
+                     if not mod.get('is_dependency') or mod['id'] not in dependency_mods]
 
         hierarchical_list = []
         processed_mods = set()
 
-        def add_mod_with_dependencies(mod, indent_level=0):
-            if mod['id'] in processed_mods:
-                return
+        # Explicit stack instead of recursion so long dependency chains cannot hit the recursion limit.
+        def add_mod_with_dependencies(start_mod):
+            stack = [(start_mod, 0)]
+            while stack:
+                mod, indent_level = stack.pop()
+                if mod['id'] in processed_mods:
+                    continue
 
-            processed_mods.add(mod['id'])
-            hierarchical_list.append((mod, indent_level))
+                processed_mods.add(mod['id'])
+                hierarchical_list.append((mod, indent_level))
 
-            m_dependencies = mod.get('info', {}).get('dependencies', [])
-            for dep_id in m_dependencies:
-                if dep_id in filtered_mods_ids and dep_id in all_mods_by_id:
-                    dep_mod = all_mods_by_id[dep_id]
-                    add_mod_with_dependencies(dep_mod, indent_level + 1)
+                for dep_id in reversed(mod['_index'].deps):
+                    if dep_id in filtered_mods_ids and dep_id in id_to_index:
+                        stack.append((all_mods[id_to_index[dep_id]], indent_level + 1))
 
         for mod in root_mods:
             add_mod_with_dependencies(mod)
@@ -281,36 +420,77 @@ class SteamWorkshopDownloader:
 
         return hierarchical_list
 
-    def process_queue(self):
-        """Process messages from the background thread queue."""
+    def _create_wakeup_pipe(self):
+        """
+        Register a self-pipe with Tk so producers can wake the UI thread instead of it polling.
+        Returns (read_fd, write_fd), or None where Tk file handlers are unavailable (e.g. Windows).
+        """
+        if os.name == 'nt' or not hasattr(self.root.tk, 'createfilehandler'):
+            return None
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
         try:
-            messages_processed = 0
-            max_messages = 50 if self.is_downloading else 10
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_queue_ready)
+        except Exception:
+            os.close(read_fd)
+            os.close(write_fd)
+            return None
+        return read_fd, write_fd
+
+    def _on_queue_ready(self, fd, mask):
+        """Tk file handler for the wakeup pipe: discard the wakeup bytes and drain the queue."""
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self.process_queue()
 
-            while messages_processed < max_messages:
-                try:
-                    message_type, data = self.download_queue.get_nowait()
-                    messages_processed += 1
+    def _post(self, message_type, data):
+        """Queue a message for the UI thread. Safe to call from any thread."""
+        self.download_queue.append((message_type, data))
+        if self._queue_event.is_set():
+            return
+        self._queue_event.set()
+        if self._wakeup_fds:
+            try:
+                os.write(self._wakeup_fds[1], b"\0")
+            except (BlockingIOError, OSError):
+                # A full pipe already guarantees a wakeup; a closed one means we are shutting down.
+                pass
 
+    def process_queue(self):
+        """Process messages from the background thread queue."""
+        drained_count = 0
+        max_messages = 50 if self.is_downloading else 10
+        pending = self._new_pending_updates()
+        try:
+            if self._queue_event.is_set():
+                # Clear before draining so a producer posting mid-drain re-arms it.
+                self._queue_event.clear()
+                while drained_count < max_messages:
+                    try:
+                        message_type, data = self.download_queue.popleft()
+                    except IndexError:
+                        break
+                    drained_count += 1
+
+                    # Coalesce per tick; only the last status/progress is visible anyway.
                     if message_type == "status":
-                        self.status_label.config(text=data)
+                        pending["status"] = data
                     elif message_type == "log":
-                        if self.log_popup:
-                            self.log_popup.add_log(data)
+                        pending["log"].append(data)
                     elif message_type == "progress":
-                        if self.log_popup:
-                            self.log_popup.update_progress(data["current"], data["total"])
-                    elif message_type == "info_updated":
-                        self.mod_manager.save_mods()
-                        self.refresh_listbox()
-                        if self.current_selection:
-                            self.show_mod_info(None)
+                        pending["progress"] = data
+                    elif message_type == "info_dirty":
+                        self._dirty_mod_ids.add(data)
                     elif message_type == "description_updated":
-                        mod_id = data
-                        if self._is_mod_selected(mod_id):
-                            self.show_mod_info(None)
-                        self.mod_manager.save_mods()
+                        pending["descriptions"].add(data)
                     elif message_type == "download_finished":
+                        self._apply_pending_updates(pending)
+                        pending = self._new_pending_updates()
+
                         result = data
                         if self.log_popup:
                             self.log_popup.destroy()
@@ -321,33 +501,73 @@ class SteamWorkshopDownloader:
                         failed_count = len(result['failed_ids'])
 
                         if failed_count == 0:
-                            self.status_label.config(text=f"Successfully downloaded all {successful} mod(s).")
+                            self._set_status(f"Successfully downloaded all {successful} mod(s).")
                         else:
-                            self.status_label.config(text=f"Downloaded {successful} mod(s). {failed_count} failed.")
+                            self._set_status(f"Downloaded {successful} mod(s). {failed_count} failed.")
 
                         DownloadCompletionDialog(self.root, result)
                         self.is_downloading = False
                         self.toggle_buttons(tk.NORMAL)
 
-                except queue.Empty:
-                    break
+                if self.download_queue:
+                    self._queue_event.set()
+
+            self._apply_pending_updates(pending)
 
         except Exception as e:
             print(f"Error processing queue: {e}")
         finally:
-            interval = 20 if self.is_downloading else 100
-            self.root.after(interval, self.process_queue)
-
-    def _is_mod_selected(self, mod_id):
-        """Check if a specific mod is currently selected."""
+            if self._queue_after_id is not None:
+                self.root.after_cancel(self._queue_after_id)
+                self._queue_after_id = None
+
+            # Poll fast while messages keep coming, back off when idle. With the wakeup pipe an
+            # idle queue needs no timer at all; only a drain cut short by max_messages reschedules.
+            if drained_count >= max_messages:
+                interval = 10
+            elif self._wakeup_fds:
+                interval = None
+            elif drained_count:
+                interval = 50
+            else:
+                interval = 200
+            if interval is not None:
+                self._queue_after_id = self.root.after(interval, self.process_queue)
+
+    @staticmethod
+    def _new_pending_updates():
+        """Return an empty batch of UI updates for one process_queue tick."""
+        return {"status": None, "log": [], "progress": None, "descriptions": set()}
+
+    def _apply_pending_updates(self, pending):
+        """Apply a batch of coalesced UI updates with one widget call per kind."""
+        if pending["status"] is not None:
+            self._set_status(pending["status"])
+        if self.log_popup:
+            if pending["log"]:
+                self.log_popup.add_log("".join(pending["log"]))
+            if pending["progress"] is not None:
+                self.log_popup.update_progress(pending["progress"]["current"], pending["progress"]["total"])
+
+        # Mods whose info changed since the last tick: one save and one refresh covers all of them.
+        dirty_ids, self._dirty_mod_ids = self._dirty_mod_ids, set()
+        changed_ids = dirty_ids | pending["descriptions"]
+        if changed_ids:
+            self.mod_manager.save_mods()
+        if dirty_ids:
+            self.refresh_listbox()
+        if self.current_selection and not changed_ids.isdisjoint(self._selected_mod_ids()):
+            self.show_mod_info(None)
+
+    def _selected_mod_ids(self):
+        """Return the ids of the currently selected mods."""
         all_mods = self.mod_manager.get_all_mods()
+        selected_ids = set()
         for listbox_index in self.current_selection:
-            if listbox_index in self.listbox_to_mod_index:
-                mod_index = self.listbox_to_mod_index[listbox_index]
-                if 0 <= mod_index < len(all_mods):
-                    if all_mods[mod_index]['id'] == mod_id:
-                        return True
-        return False
+            mod_index = self.listbox_to_mod_index.get(listbox_index)
+            if mod_index is not None and 0 <= mod_index < len(all_mods):
+                selected_ids.add(all_mods[mod_index]['id'])
+        return selected_ids
 
     def refresh_listbox(self):
         """Refresh the listbox with current mod data, applying current filter."""
@@ -366,33 +586,70 @@ class SteamWorkshopDownloader:
             return
 
         self.entry.delete(0, tk.END)
-        self.status_label.config(text=f"Added mod {mod_id}, fetching info...")
+        self._set_status(f"Added mod {mod_id}, fetching info...")
         self.mod_manager.save_mods()
         self.refresh_listbox()
 
         self._start_info_fetch(mod_id)
 
     def _start_info_fetch(self, mod_id):
-        """Start background info fetching for a mod with proper thread tracking."""
-        fetch_thread = threading.Thread(target=self._fetch_info_worker, args=(mod_id,), daemon=True)
-        self.active_threads.append(fetch_thread)
-        fetch_thread.start()
-
-        self.active_threads = [t for t in self.active_threads if t.is_alive()]
-
-    def _fetch_info_worker(self, mod_id):
-        """Fetches info and then triggers dependency checks with shutdown check."""
-        try:
-            if self.shutdown_event.is_set():
+        """Queue background info fetching for a mod unless it is already queued or in flight."""
+        if self.shutdown_event.is_set():
+            return
+        with self._fetch_pending_lock:
+            if mod_id in self._fetch_pending:
                 return
-
-            fetched_info = self.steam_api.fetch_mod_info(mod_id)
-
-            if self.shutdown_event.is_set():
+            self._fetch_pending.add(mod_id)
+        self._fetch_queue.put(mod_id)
+
+    def _fetch_loop(self):
+        """Worker loop: fetch info for queued mod ids, a batch at a time, until a None sentinel arrives."""
+        while True:
+            mod_id = self._fetch_queue.get()
+            if mod_id is None:
+                self._fetch_queue.task_done()
                 return
 
+            # Take whatever else is already queued so it shares one API request.
+            batch = [mod_id]
+            while len(batch) < config.STEAM_API_BATCH_SIZE:
+                try:
+                    next_id = self._fetch_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_id is None:
+                    self._fetch_queue.task_done()
+                    self._fetch_queue.put(None)
+                    break
+                batch.append(next_id)
+
+            try:
+                self._fetch_info_batch(batch)
+            finally:
+                with self._fetch_pending_lock:
+                    self._fetch_pending.difference_update(batch)
+                for _ in batch:
+                    self._fetch_queue.task_done()
+
+    def _fetch_info_batch(self, mod_ids):
+        """Fetches info for mod_ids and applies each result as it arrives."""
+        if self.shutdown_event.is_set():
+            return
+        try:
+            for mod_id, fetched_info in self.steam_api.fetch_many(mod_ids):
+                if self.shutdown_event.is_set():
+                    return
+                self._apply_fetched_info(mod_id, fetched_info)
+        except Exception as e:
+            if not self.shutdown_event.is_set():
+                print(f"Error fetching info for mods {', '.join(mod_ids)}: {e}")
+                self._post("status", f"Error fetching mod info: {e}")
+
+    def _apply_fetched_info(self, mod_id, fetched_info):
+        """Stores fetched info and then triggers dependency checks with shutdown check."""
+        try:
             self.mod_manager.update_mod_info(mod_id, fetched_info)
-            self.download_queue.put(("info_updated", None))
+            self._post("info_dirty", mod_id)
 
             dependency_ids = fetched_info.get("dependencies", [])
             for dep_id in dependency_ids:
@@ -402,7 +659,7 @@ class SteamWorkshopDownloader:
                 existing_mod = self.mod_manager.get_mod_by_id(dep_id)
                 if existing_mod and not existing_mod.get("is_dependency", False):
                     self.mod_manager.mark_as_dependency(dep_id)
-                    self.download_queue.put(("info_updated", None))
+                    self._post("info_dirty", dep_id)
 
                 if self.mod_manager.add_mod_by_id(dep_id, is_dependency=True):
                     self._start_info_fetch(dep_id)
@@ -410,7 +667,7 @@ class SteamWorkshopDownloader:
         except Exception as e:
             if not self.shutdown_event.is_set():
                 print(f"Error fetching info for mod {mod_id}: {e}")
-                self.download_queue.put(("status", f"Error fetching info for mod {mod_id}: {e}"))
+                self._post("status", f"Error fetching info for mod {mod_id}: {e}")
 
     def _fetch_description_worker(self, mod_id):
         """Fetches only the description for a mod using the Steam API."""
@@ -418,22 +675,25 @@ class SteamWorkshopDownloader:
             description = self.steam_api.fetch_mod_description(mod_id)
             if description:
                 self.mod_manager.update_mod_description(mod_id, description)
-                self.download_queue.put(("description_updated", mod_id))
+                self._post("description_updated", mod_id)
         except Exception as e:
             print(f"Error fetching description for mod {mod_id}: {e}")
+        finally:
+            with self._inflight_lock:
+                self._inflight_desc.discard(mod_id)
 
     def delete_selected(self):
         """Delete the selected mod(s)."""
         if not self.current_selection:
             return
 
+        all_mods = self.mod_manager.get_all_mods()
         mods_to_delete = []
         for listbox_index in self.current_selection:
             if listbox_index in self.listbox_to_mod_index:
                 mod_index = self.listbox_to_mod_index[listbox_index]
-                mod = self.mod_manager.get_mod_by_index(mod_index)
-                if mod:
-                    mods_to_delete.append((mod_index, mod))
+                if 0 <= mod_index < len(all_mods):
+                    mods_to_delete.append((mod_index, all_mods[mod_index]))
 
         if not mods_to_delete:
             return
@@ -470,13 +730,22 @@ class SteamWorkshopDownloader:
         if self.is_downloading and state == tk.NORMAL:
             return
 
+        all_state = state if self.mod_manager.get_mods_count() > 0 else tk.DISABLED
+        if (state, all_state) == self._last_buttons_state:
+            return
+        self._last_buttons_state = (state, all_state)
+
         self.add_button.config(state=state)
         self.execute_button.config(state=state)
         self.delete_button.config(state=state)
-
-        all_state = state if self.mod_manager.get_mods_count() > 0 else tk.DISABLED
         self.download_all_button.config(state=all_state)
 
+    def _set_status(self, text):
+        """Update the status bar, skipping the Tk call when the text is unchanged."""
+        if text != self._last_status:
+            self._last_status = text
+            self.status_label.config(text=text)
+
     def download_selected(self):
         """Download selected mods and their dependencies."""
         if self.is_downloading:
@@ -500,7 +769,7 @@ class SteamWorkshopDownloader:
         if not initial_mod_indices:
             return
 
-        self.status_label.config(text="Preparing download - resolving dependencies...")
+        self._set_status("Preparing download - resolving dependencies...")
         self.toggle_buttons(tk.DISABLED)
 
         prep_thread = threading.Thread(target=self._prepare_download_worker, args=(initial_mod_indices,), daemon=True)
@@ -527,7 +796,7 @@ class SteamWorkshopDownloader:
 
     def _handle_dependency_resolution_error(self, error_msg):
         """Handle dependency resolution errors on the main thread."""
-        self.status_label.config(text="Ready")
+        self._set_status("Ready")
         self.toggle_buttons(tk.NORMAL)
         messagebox.showerror("Dependency Resolution Error", error_msg)
 
@@ -535,11 +804,12 @@ class SteamWorkshopDownloader:
         """Handle dependency resolution completion on the main thread."""
         try:
             all_mods = self.mod_manager.get_all_mods()
+            mods_by_id = {mod['id']: mod for mod in all_mods}
 
             if added_deps_ids:
                 added_deps_titles = []
                 for dep_id in added_deps_ids:
-                    mod = self.mod_manager.get_mod_by_id(dep_id)
+                    mod = mods_by_id.get(dep_id)
                     if mod:
                         title = mod.get('info', {}).get('title', dep_id)
                         added_deps_titles.append(title)
@@ -550,7 +820,7 @@ class SteamWorkshopDownloader:
                     msg += "\n\nDo you want to continue?"
 
                     self.toggle_buttons(tk.NORMAL)
-                    self.status_label.config(text="Ready")
+                    self._set_status("Ready")
 
                     if not messagebox.askyesno("Dependencies Found", msg):
                         return
@@ -563,7 +833,7 @@ class SteamWorkshopDownloader:
                     mods_to_download.append(mod)
 
             if not mods_to_download:
-                self.status_label.config(text="Ready")
+                self._set_status("Ready")
                 self.toggle_buttons(tk.NORMAL)
                 return
 
@@ -572,22 +842,37 @@ class SteamWorkshopDownloader:
         except Exception as e:
             error_msg = f"Error preparing download: {e}"
             print(f"Download preparation error: {e}")
-            self.status_label.config(text="Ready")
+            self._set_status("Ready")
             self.toggle_buttons(tk.NORMAL)
             messagebox.showerror("Download Preparation Error", error_msg)
 
     def _update_selection_with_dependencies(self, final_mod_ids_to_download):
         """Update the listbox selection to include dependencies."""
-        self.listbox.selection_clear(0, tk.END)
-        hierarchical_list = self._build_filtered_hierarchical_list()
-        new_selection = []
-
-        for listbox_index, (mod, indent_level) in enumerate(hierarchical_list):
-            if mod['id'] in final_mod_ids_to_download:
-                self.listbox.selection_set(listbox_index)
-                new_selection.append(listbox_index)
+        new_selection = [listbox_index for listbox_index, (mod, indent_level) in enumerate(self.filtered_hierarchy)
+                         if mod['id'] in final_mod_ids_to_download]
 
-        self.current_selection = new_selection
+        self._suppress_select = True
+        try:
+            self.listbox.selection_clear(0, tk.END)
+            self._select_listbox_indices(new_selection)
+        finally:
+            self._suppress_select = False
+
+        self._on_listbox_select(None)
+
+    def _select_listbox_indices(self, indices):
+        """Select the given ascending listbox indices, one selection_set call per consecutive run."""
+        run_start = None
+        previous = None
+        for index in indices:
+            if run_start is None:
+                run_start = index
+            elif index != previous + 1:
+                self.listbox.selection_set(run_start, previous)
+                run_start = index
+            previous = index
+        if run_start is not None:
+            self.listbox.selection_set(run_start, previous)
 
     def download_all(self):
         """Download all mods in the list (respecting current filter)."""
@@ -632,7 +917,7 @@ class SteamWorkshopDownloader:
 
         self.is_downloading = True
         self.toggle_buttons(tk.DISABLED)
-        self.status_label.config(text="Starting download...")
+        self._set_status("Starting download...")
 
         self.root.update_idletasks()
 
@@ -669,6 +954,14 @@ class SteamWorkshopDownloader:
 
             print(f"Download worker started with {len(mods_to_download)} mods")
 
+            need_fetch = [mod["id"] for mod in mods_to_download if not mod.get("info", {}).get("app_id")]
+            fetched_infos = {}
+            if need_fetch:
+                self._post("status", f"Fetching info for {len(need_fetch)} mod(s)...")
+                self._post("log", f"Fetching info for {len(need_fetch)} mod(s)...\n")
+
+                fetched_infos = self.steam_api.fetch_mod_info_batch(need_fetch)
+
             valid_mods = []
             for i, mod in enumerate(mods_to_download):
                 if self.shutdown_event.is_set():
@@ -676,37 +969,26 @@ class SteamWorkshopDownloader:
 
                 try:
                     mod_id = mod["id"]
-                    mod_info = mod.get("info", {})
-
-                    self.download_queue.put(("status", f"Checking mod {i + 1}/{len(mods_to_download)}: {mod_id}"))
-
-                    if not mod_info.get("app_id"):
-                        if self.shutdown_event.is_set():
-                            return
 
-                        self.download_queue.put(("status", f"Fetching info for mod {mod_id}..."))
-                        self.download_queue.put(("log", f"Fetching info for mod {mod_id}...\n"))
-
-                        fetched_info = self.steam_api.fetch_mod_info(mod_id)
-
-                        if self.shutdown_event.is_set():
-                            return
+                    self._post("status", f"Checking mod {i + 1}/{len(mods_to_download)}: {mod_id}")
 
+                    if mod_id in fetched_infos:
+                        fetched_info = fetched_infos[mod_id]
                         if "error" in fetched_info:
                             error_msg = f"Error fetching info for {mod_id}: {fetched_info['error']}"
-                            self.download_queue.put(("status", error_msg))
-                            self.download_queue.put(("log", f"{error_msg}\n"))
+                            self._post("status", error_msg)
+                            self._post("log", f"{error_msg}\n")
                             continue
 
                         self.mod_manager.update_mod_info(mod_id, fetched_info)
-                        self.download_queue.put(("info_updated", None))
+                        self._post("info_dirty", mod_id)
                         mod["info"] = fetched_info
 
                     app_id = mod["info"].get("app_id")
                     if not app_id:
                         error_msg = f"⚠️ Could not find App ID for mod {mod_id}. Skipping."
-                        self.download_queue.put(("status", error_msg))
-                        self.download_queue.put(("log", f"{error_msg}\n"))
+                        self._post("status", error_msg)
+                        self._post("log", f"{error_msg}\n")
                         continue
 
                     valid_mods.append(mod)
@@ -714,48 +996,40 @@ class SteamWorkshopDownloader:
                 except Exception as e:
                     if not self.shutdown_event.is_set():
                         error_msg = f"Error processing mod {mod.get('id', 'unknown')}: {e}"
-                        self.download_queue.put(("log", f"{error_msg}\n"))
+                        self._post("log", f"{error_msg}\n")
                         print(f"Error processing mod: {e}")
 
             if self.shutdown_event.is_set():
                 return
 
             if not valid_mods:
-                self.download_queue.put(("log", "No valid mods found for download.\n"))
+                self._post("log", "No valid mods found for download.\n")
                 error_result = {'completed': 0, 'successful': 0, 'failed_ids': [], 'failed_details': []}
-                self.download_queue.put(("download_finished", error_result))
+                self._post("download_finished", error_result)
                 return
 
-            self.download_queue.put(("status", f"Starting download of {len(valid_mods)} valid mods..."))
-            self.download_queue.put(("log", f"Starting download of {len(valid_mods)} valid mods...\n"))
-
-            def progress_callback(current, total):
-                if not self.shutdown_event.is_set():
-                    self.download_queue.put(("progress", {"current": current, "total": total}))
+            self._post("status", f"Starting download of {len(valid_mods)} valid mods...")
+            self._post("log", f"Starting download of {len(valid_mods)} valid mods...\n")
 
-            def log_callback(message):
-                if not self.shutdown_event.is_set():
-                    self.download_queue.put(("log", message))
-
-            def status_callback(status):
-                if not self.shutdown_event.is_set():
-                    self.download_queue.put(("status", status))
-
-            download_result = self.steamcmd_downloader.download_mods(valid_mods, progress_callback, log_callback,
-                status_callback)
+            emitter = _Emitter(self._post, self.shutdown_event)
+            try:
+                download_result = self.steamcmd_downloader.download_mods(valid_mods, emitter.progress, emitter.log,
+                                                                         emitter.status)
+            finally:
+                emitter.close()
 
             if not self.shutdown_event.is_set():
-                self.download_queue.put(("download_finished", download_result))
+                self._post("download_finished", download_result)
 
         except Exception as e:
             if not self.shutdown_event.is_set():
                 error_msg = f"Unexpected error during download: {e}"
                 print(f"Download worker error: {e}")
-                self.download_queue.put(("log", error_msg + "\n"))
-                self.download_queue.put(("status", error_msg))
+                self._post("log", error_msg + "\n")
+                self._post("status", error_msg)
 
                 error_result = {'completed': 0, 'successful': 0, 'failed_ids': [], 'failed_details': []}
-                self.download_queue.put(("download_finished", error_result))
+                self._post("download_finished", error_result)
 
     def show_description_popup(self):
         """Shows the description in a webview popup with BBCode parsing."""
@@ -806,8 +1080,12 @@ class SteamWorkshopDownloader:
             description = info.get('description', '')
             if (not description or not description.strip()) and not info.get("title", "").startswith(
                     "Fetching info for") and "error" not in info:
-                fetch_thread = threading.Thread(target=self._fetch_description_worker, args=(mod['id'],), daemon=True)
-                fetch_thread.start()
+                mod_id = mod['id']
+                with self._inflight_lock:
+                    if mod_id in self._inflight_desc:
+                        return
+                    self._inflight_desc.add(mod_id)
+                SteamAPI._pool.submit(self._fetch_description_worker, mod_id)
 
     def _show_multiple_mod_info(self):
         """Show summary info for multiple selected mods."""
@@ -842,14 +1120,28 @@ class SteamWorkshopDownloader:
                     pass
                 self.log_popup = None
 
-            for thread in self.active_threads:
-                if thread.is_alive():
-                    thread.join(timeout=1.0)
+            for _ in self._fetch_workers:
+                self._fetch_queue.put(None)
+
+            # Closing the session only drops idle connections and stops new requests; a request already
+            # in flight runs until its own timeout. The shared one-second join just caps how long we wait.
+            SteamAPI.shutdown()
+            SteamAPI.close_session()
+            deadline = time.monotonic() + 1.0
+            for worker in self._fetch_workers:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if worker.is_alive():
+                    worker.join(timeout=remaining)
 
-            active_threads = [t for t in threading.enumerate() if t != threading.current_thread()]
-            for thread in active_threads:
-                if hasattr(thread, 'daemon') and not thread.daemon:
-                    continue
+            self.mod_manager.flush()
+
+            if self._wakeup_fds:
+                wakeup_fds, self._wakeup_fds = self._wakeup_fds, None
+                self.root.tk.deletefilehandler(wakeup_fds[0])
+                for fd in wakeup_fds:
+                    os.close(fd)
 
         except Exception as e:
             print(f"Error during cleanup: {e}")
@@ -1,41 +1,160 @@
+import gzip
 import json
 import os
 import re
+import sys
 import threading
-from typing import List, Dict, Optional, Set
+from collections import deque
+from typing import List, Dict, Optional, Set, Tuple
 
 import config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_URL_RE = re.compile(r"steamcommunity\.com/(?:sharedfiles|workshop)/filedetails/\?.*id=(\d+)")
+
+
+def _intern_deps(dependencies) -> Tuple[str, ...]:
+    """Return dependencies as a tuple of interned id strings."""
+    return tuple(sys.intern(str(dep_id)) for dep_id in dependencies)
+
+
+class ModIndex:
+    """Derived lookup data for one mod, stored (not persisted) on the mod dict under "_index"."""
+
+    __slots__ = ("search_blob", "deps", "dep_set", "file_size")
+
+    def __init__(self, search_blob: str, deps: Tuple[str, ...], file_size: int = 0):
+        self.search_blob = search_blob
+        self.deps = deps
+        self.dep_set = frozenset(deps)
+        self.file_size = file_size
+
 
 class ModManager:
     """Handles mod data management and persistence with improved dependency resolution."""
 
     def __init__(self, data_file: str = config.DATA_FILE):
         self.data_file = data_file
+        self._loaded_legacy = False
         self.mods = self._load_mods()
         self.mods_lock = threading.Lock()
+        # Bumped on every mutation so callers can cache views derived from the mod list.
+        self.version = 0
+        # id -> mod, kept in step with self.mods by every add/remove.
+        self._by_id: Dict[str, Dict] = {}
+        for mod in self.mods:
+            self._by_id.setdefault(mod['id'], mod)
+        # dep_id -> ids of the mods that require it, updated incrementally with every dependency change.
+        self._reverse_deps: Dict[str, Set[str]] = {}
+        for mod in self.mods:
+            self._link_dependencies(mod['id'], frozenset(), mod['_index'].dep_set)
+        # Cached get_all_mods() result; reset to None whenever mods are added or removed.
+        self._snapshot: Optional[Tuple[Dict, ...]] = None
+        # id -> catalog position, for the snapshot it was built from; used to order find_dependents results.
+        self._positions: Tuple[Optional[Tuple[Dict, ...]], Dict[str, int]] = (None, {})
+        # save_mods only marks the catalog dirty; a short timer (or flush()) writes it out.
+        self._dirty = self._loaded_legacy
+        self._save_timer: Optional[threading.Timer] = None
+        self._write_lock = threading.Lock()
 
     def _load_mods(self) -> List[Dict]:
-        """Load mods from the JSON data file."""
-
-        if os.path.exists(self.data_file):
-            with open(self.data_file, "r", encoding="utf-8") as f:
+        """Load mods from the JSON data file, gzip-compressed or plain."""
+        path = self.data_file
+        if not os.path.exists(path) and path.endswith(".gz") and os.path.exists(path[:-3]):
+            # Catalog from before compression; the next save writes the .gz file.
+            path = path[:-3]
+            self._loaded_legacy = True
+
+        if os.path.exists(path):
+            with open(path, "rb") as f:
                 content = f.read()
-                mods = json.loads(content)
+            if content[:2] == b"\x1f\x8b":
+                content = gzip.decompress(content)
+            mods = orjson.loads(content) if orjson else json.loads(content)
 
             for m in mods:
                 if m.get("info") is None:
                     m["info"] = {}
                 if "is_dependency" not in m:
                     m["is_dependency"] = False
+                self._index_mod(m)
             return mods
         return []
 
+    @staticmethod
+    def _index_mod(mod: Dict) -> None:
+        """
+        Normalise the mod's id and dependency ids to interned str, then refresh its derived, non-persisted
+        lookup fields (keys starting with '_').
+        """
+        mod["id"] = sys.intern(str(mod["id"]))
+        info = mod.get("info", {})
+        deps = _intern_deps(info.get("dependencies", ()))
+        if "dependencies" in info:
+            info["dependencies"] = deps
+        title = info.get("title", "")
+        try:
+            file_size = int(info.get("file_size", 0))
+        except (ValueError, TypeError):
+            file_size = 0
+        # Replaced as a whole so lock-free readers always see a consistent record.
+        mod["_index"] = ModIndex(f"{title}\0{mod['id']}\0{mod.get('url', '')}".casefold(), deps, file_size)
+
     def save_mods(self) -> None:
-        """Save mods to the JSON data file."""
+        """Schedule a save of the mods; bursts of calls within SAVE_DEBOUNCE_SECONDS result in one write."""
         with self.mods_lock:
-            with open(self.data_file, "w") as f:
-                json.dump(self.mods, f, indent=2)
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(config.SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to the JSON data file now, leaving out derived fields."""
+        with self._write_lock:
+            with self.mods_lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                mods = [{k: v for k, v in m.items() if not k.startswith("_")} for m in self.mods]
+                if orjson:
+                    content = orjson.dumps(mods, option=orjson.OPT_INDENT_2)
+                else:
+                    content = json.dumps(mods, indent=2).encode("utf-8")
+            if self.data_file.endswith(".gz"):
+                # Level 1 keeps most of JSON's compression ratio for very little CPU.
+                content = gzip.compress(content, compresslevel=1)
+
+            # Write a sibling temp file and swap it in, so a crash mid-write never truncates the catalog.
+            tmp_path = self.data_file + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, self.data_file)
+            except OSError as e:
+                # Keep the changes pending so the next save_mods() or flush() tries again.
+                with self.mods_lock:
+                    self._dirty = True
+                print(f"Warning: Could not save mods to {self.data_file}: {e}")
+
+    def _link_dependencies(self, mod_id: str, old_deps: frozenset, new_deps: frozenset) -> None:
+        """Move mod_id's entries in the reverse dependency map from old_deps to new_deps."""
+        for dep_id in old_deps - new_deps:
+            dependents = self._reverse_deps.get(dep_id)
+            if dependents is not None:
+                dependents.discard(mod_id)
+                if not dependents:
+                    del self._reverse_deps[dep_id]
+        for dep_id in new_deps - old_deps:
+            self._reverse_deps.setdefault(dep_id, set()).add(mod_id)
 
     def add_mod_by_url(self, url: str) -> Optional[str]:
         """
@@ -43,8 +162,7 @@ class ModManager:
         Returns the mod_id if successful, None if invalid URL.
         """
 
-        pattern = r"steamcommunity\.com/(?:sharedfiles|workshop)/filedetails/\?.*id=(\d+)"
-        match = re.search(pattern, url)
+        match = _URL_RE.search(url)
 
         if not match:
             return None
@@ -58,13 +176,15 @@ class ModManager:
         Add a mod to the list by its ID, checking for duplicates.
         Returns True if mod was added or updated, False if already exists unchanged.
         """
+        mod_id = str(mod_id)
         with self.mods_lock:
-            existing_mod = next((m for m in self.mods if m['id'] == mod_id), None)
+            existing_mod = self._by_id.get(mod_id)
 
             if existing_mod:
 
                 if existing_mod.get("is_dependency") and not is_dependency:
                     existing_mod["is_dependency"] = False
+                    self.version += 1
                     return True
 
                 return False
@@ -72,30 +192,43 @@ class ModManager:
             url = f"https://steamcommunity.com/workshop/filedetails/?id={mod_id}"
             title = f"Fetching info for {mod_id}..." if not is_dependency else f"Fetching dependency {mod_id}..."
             mod = {"id": mod_id, "url": url, "info": {"title": title}, "is_dependency": is_dependency}
+            self._index_mod(mod)
             self.mods.append(mod)
+            self._by_id[mod["id"]] = mod
+            self._link_dependencies(mod["id"], frozenset(), mod["_index"].dep_set)
+            self._snapshot = None
+            self.version += 1
             return True
 
     def remove_mod(self, mod_id: str) -> bool:
         """Remove a mod by its ID. Returns True if removed, False if not found."""
         with self.mods_lock:
-            for i, mod in enumerate(self.mods):
-                if mod['id'] == mod_id:
-                    del self.mods[i]
-                    return True
-            return False
+            mod = self._by_id.pop(mod_id, None)
+            if mod is None:
+                return False
+            self.mods.remove(mod)
+            self._link_dependencies(mod_id, mod['_index'].dep_set, frozenset())
+            self._snapshot = None
+            self.version += 1
+            return True
 
     def remove_mod_by_index(self, index: int) -> bool:
         """Remove a mod by its index. Returns True if removed, False if invalid index."""
         with self.mods_lock:
             if 0 <= index < len(self.mods):
-                del self.mods[index]
+                mod = self.mods.pop(index)
+                self._snapshot = None
+                if self._by_id.get(mod['id']) is mod:
+                    del self._by_id[mod['id']]
+                    self._link_dependencies(mod['id'], mod['_index'].dep_set, frozenset())
+                self.version += 1
                 return True
             return False
 
     def get_mod_by_id(self, mod_id: str) -> Optional[Dict]:
         """Get a mod by its ID."""
         with self.mods_lock:
-            return next((m for m in self.mods if m['id'] == mod_id), None)
+            return self._by_id.get(mod_id)
 
     def get_mod_by_index(self, index: int) -> Optional[Dict]:
         """Get a mod by its index."""
@@ -107,27 +240,44 @@ class ModManager:
     def update_mod_info(self, mod_id: str, info: Dict) -> bool:
         """Update mod info. Returns True if updated, False if mod not found."""
         with self.mods_lock:
-            mod = next((m for m in self.mods if m['id'] == mod_id), None)
+            mod = self._by_id.get(mod_id)
             if mod:
+                old_deps = mod["_index"].dep_set
                 mod["info"] = info
+                self._index_mod(mod)
+                self._link_dependencies(mod_id, old_deps, mod["_index"].dep_set)
+                if old_deps != mod["_index"].dep_set:
+                    # Readers key dependency indexes on snapshot identity.
+                    self._snapshot = None
+                self.version += 1
                 return True
             return False
 
     def update_mod_description(self, mod_id: str, description: str) -> bool:
         """Update only the description of a mod. Returns True if updated, False if mod not found."""
         with self.mods_lock:
-            mod = next((m for m in self.mods if m['id'] == mod_id), None)
+            mod = self._by_id.get(mod_id)
             if mod:
                 if "info" not in mod:
                     mod["info"] = {}
                 mod["info"]["description"] = description
+                self.version += 1
                 return True
             return False
 
-    def get_all_mods(self) -> List[Dict]:
-        """Get all mods (returns a copy to prevent external modifications)."""
+    def get_all_mods(self) -> Tuple[Dict, ...]:
+        """
+        Get all mods as a read-only snapshot, shared between callers until a mod is added or removed or its
+        dependencies change.
+        """
         with self.mods_lock:
-            return self.mods.copy()
+            return self._snapshot_locked()
+
+    def _snapshot_locked(self) -> Tuple[Dict, ...]:
+        """Return the cached tuple of mods, rebuilding it if needed. Call with mods_lock held."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self.mods)
+        return self._snapshot
 
     def get_mods_count(self) -> int:
         """Get the total number of mods."""
@@ -136,43 +286,51 @@ class ModManager:
 
     def find_dependents(self, mod_id: str) -> List[Dict]:
         """Find all mods that depend on the given mod_id."""
-        dependents = []
         with self.mods_lock:
-            for mod in self.mods:
-                dependencies = mod.get('info', {}).get('dependencies', [])
-                if mod_id in dependencies:
-                    dependents.append(mod)
-        return dependents
+            dependents = [self._by_id[dependent_id] for dependent_id in self._reverse_deps.get(mod_id, ())
+                          if dependent_id in self._by_id]
+            if len(dependents) > 1:
+                # The reverse map holds sets; return dependents in catalog order so callers' output is stable.
+                snapshot = self._snapshot_locked()
+                if self._positions[0] is not snapshot:
+                    positions = {}
+                    for position, mod in enumerate(snapshot):
+                        positions.setdefault(mod['id'], position)
+                    self._positions = (snapshot, positions)
+                positions = self._positions[1]
+                dependents.sort(key=lambda mod: positions[mod['id']])
+            return dependents
 
     def get_all_dependencies_efficient(self, mod_ids: Set[str]) -> Set[str]:
         """
         Efficiently find all dependencies for a set of mod IDs using iterative approach.
         This prevents infinite recursion and is much faster for large dependency trees.
         """
+        with self.mods_lock:
+            mods_dict = dict(self._by_id)
+
+        # Traverse the snapshot without the lock; BFS order keeps closer dependencies first.
         all_dependencies = set()
-        to_process = set(mod_ids)
+        to_process = deque(mod_ids)
         processed = set()
 
-        with self.mods_lock:
-            mods_dict = {mod['id']: mod for mod in self.mods}
-
         while to_process:
-            current_id = to_process.pop()
+            current_id = to_process.popleft()
 
             if current_id in processed:
                 continue
 
             processed.add(current_id)
 
-            if current_id in mods_dict:
-                mod = mods_dict[current_id]
-                dependencies = mod.get('info', {}).get('dependencies', [])
+            mod = mods_dict.get(current_id)
+            if mod is None:
+                continue
 
-                for dep_id in dependencies:
-                    all_dependencies.add(dep_id)
+            for dep_id in mod['_index'].deps:
+                all_dependencies.add(dep_id)
 
-                    if dep_id not in processed:
-                        to_process.add(dep_id)
+                if dep_id not in processed:
+                    to_process.append(dep_id)
 
         return all_dependencies
 
@@ -185,67 +343,62 @@ class ModManager:
 
     def build_hierarchical_list(self) -> List[tuple]:
         """Build a hierarchical list where dependencies appear directly under their parents."""
+        # Snapshot under the lock, traverse without it so fetch workers can keep updating mods.
         with self.mods_lock:
+            mods = self._snapshot_locked()
+            mods_by_id = dict(self._by_id)
 
-            mods_by_id = {mod['id']: mod for mod in self.mods}
-
-            root_mods = []
-            dependency_mods = set()
-
-            for mod in self.mods:
-                dependencies = mod.get('info', {}).get('dependencies', [])
-                dependency_mods.update(dependencies)
-
-            for mod in self.mods:
-                if not mod.get('is_dependency', False):
-                    root_mods.append(mod)
-                elif mod['id'] not in dependency_mods:
+        dependency_mods = set()
+        for mod in mods:
+            dependency_mods |= mod['_index'].dep_set
 
-                    root_mods.append(mod)
+        root_mods = [mod for mod in mods
+                     if not mod.get('is_dependency', False) or mod['id'] not in dependency_mods]
 
-            hierarchical_list = []
-            processed_mods = set()
+        hierarchical_list = []
+        processed_mods = set()
 
-            def add_mod_with_dependencies(mod, indent_level=0, visited=None):
-                if visited is None:
-                    visited = set()
+        # Iterative DFS; processed_mods alone guards against cycles since every mod is emitted once.
+        def add_mod_with_dependencies(start_mod):
+            stack = [(start_mod, 0)]
+            while stack:
+                mod, indent_level = stack.pop()
+                if mod['id'] in processed_mods:
+                    continue
 
-                if mod['id'] in visited or mod['id'] in processed_mods:
-                    return
-
-                visited.add(mod['id'])
                 processed_mods.add(mod['id'])
                 hierarchical_list.append((mod, indent_level))
 
-                dependencies = mod.get('info', {}).get('dependencies', [])
-                for dep_id in dependencies:
-                    if dep_id in mods_by_id and dep_id not in visited:
-                        dep_mod = mods_by_id[dep_id]
-                        add_mod_with_dependencies(dep_mod, indent_level + 1, visited.copy())
+                for dep_id in reversed(mod['_index'].deps):
+                    dep_mod = mods_by_id.get(dep_id)
+                    if dep_mod is not None and dep_id not in processed_mods:
+                        stack.append((dep_mod, indent_level + 1))
 
-            for mod in root_mods:
-                add_mod_with_dependencies(mod)
+        for mod in root_mods:
+            add_mod_with_dependencies(mod)
 
-            for mod in self.mods:
-                if mod['id'] not in processed_mods:
-                    add_mod_with_dependencies(mod)
+        for mod in mods:
+            if mod['id'] not in processed_mods:
+                add_mod_with_dependencies(mod)
 
-            return hierarchical_list
+        return hierarchical_list
 
     def mark_as_dependency(self, mod_id: str) -> bool:
         """Mark a mod as a dependency. Returns True if updated, False if mod not found."""
         with self.mods_lock:
-            mod = next((m for m in self.mods if m['id'] == mod_id), None)
+            mod = self._by_id.get(mod_id)
             if mod:
                 mod["is_dependency"] = True
+                self.version += 1
                 return True
             return False
 
     def mark_as_main_mod(self, mod_id: str) -> bool:
         """Mark a mod as a main mod (not a dependency). Returns True if updated, False if mod not found."""
         with self.mods_lock:
-            mod = next((m for m in self.mods if m['id'] == mod_id), None)
+            mod = self._by_id.get(mod_id)
             if mod:
                 mod["is_dependency"] = False
+                self.version += 1
                 return True
             return False
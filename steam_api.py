@@ -1,82 +1,323 @@
+import concurrent.futures
+import copy
 import html
+import json
+import os
 import re
-
-import requests
-from bs4 import BeautifulSoup, FeatureNotFound
+import threading
+from datetime import datetime, timezone, timedelta
 
 import config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_HREF_ID_RE = re.compile(r"id=(\d+)")
+
+# Fast path for the entities Workshop descriptions actually use; anything else goes through html.unescape.
+_ENTITY_RE = re.compile(r"&(?:(amp|lt|gt|quot|apos)|#([0-9]+)|#[xX]([0-9a-fA-F]+));")
+_NAMED_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+
+
+def _replace_entity(match):
+    name, decimal, hexadecimal = match.groups()
+    if name:
+        return _NAMED_ENTITIES[name]
+    codepoint = int(decimal, 10) if decimal else int(hexadecimal, 16)
+    if 0x20 <= codepoint < 0x7F or codepoint in (0x9, 0xA) or 0xA0 <= codepoint < 0xD800 or 0xE000 <= codepoint < 0xFDD0:
+        return chr(codepoint)
+    # Control characters, surrogates, noncharacters etc. have special HTML5 rules.
+    return html.unescape(match.group(0))
+
+
+def _unescape(text):
+    """html.unescape, with a fast path for text whose only entities are the common ones."""
+    if "&" not in text:
+        return text
+    replaced, count = _ENTITY_RE.subn(_replace_entity, text)
+    if count == text.count("&"):
+        return replaced
+    return html.unescape(text)
+
+
+# HTML parsing modules are imported on the first scrape rather than at startup.
+_html_parsers = None
+
+
+def _get_html_parsers():
+    """Return (HTMLParser or None, BeautifulSoup, FeatureNotFound, RequiredItems strainer), importing them once."""
+    global _html_parsers
+    if _html_parsers is None:
+        try:
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            HTMLParser = None
+        from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+        _html_parsers = (HTMLParser, BeautifulSoup, FeatureNotFound, SoupStrainer('div', id='RequiredItems'))
+    return _html_parsers
+
+
+def _scrape_dependency_ids(page_html):
+    """Extract the required item ids from a workshop page's RequiredItems block."""
+    # Most items have no requirements; skip parsing the page entirely in that case.
+    if 'RequiredItems' not in page_html:
+        return []
+
+    HTMLParser, BeautifulSoup, FeatureNotFound, required_items_strainer = _get_html_parsers()
+    if HTMLParser is not None:
+        node = HTMLParser(page_html).css_first('#RequiredItems')
+        hrefs = [] if node is None else [link.attributes.get('href') for link in node.css('a')]
+    else:
+        try:
+            soup = BeautifulSoup(page_html, 'lxml', parse_only=required_items_strainer)
+        except FeatureNotFound:
+            print("Warning: 'lxml' parser not found. Falling back to 'html.parser'. For better performance, run: pip install lxml")
+            soup = BeautifulSoup(page_html, 'html.parser', parse_only=required_items_strainer)
+        hrefs = [link.get('href') for link in soup.find_all('a')]
+
+    dependencies = []
+    for href in hrefs:
+        if href and (match := _HREF_ID_RE.search(href)):
+            dependencies.append(match.group(1))
+    return dependencies
+
+
+# mod_id -> {"fetched_at": ISO8601 timestamp, "info": {...}}, mirrored to config.MOD_INFO_CACHE_FILE.
+_info_cache = None
+_info_cache_lock = threading.Lock()
+
+
+def _load_info_cache():
+    """Load the on-disk mod info cache, once. Call with _info_cache_lock held."""
+    global _info_cache
+    if _info_cache is None:
+        _info_cache = {}
+        try:
+            with open(config.MOD_INFO_CACHE_FILE, "r", encoding="utf-8") as f:
+                _info_cache = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable mod info cache: {e}")
+    return _info_cache
+
+
+def _get_cached_info(mod_id):
+    """Return a copy of the cached info for mod_id, or None if missing or older than the TTL."""
+    with _info_cache_lock:
+        entry = _load_info_cache().get(mod_id)
+        if not entry:
+            return None
+        try:
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(entry["fetched_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if age > timedelta(seconds=config.MOD_INFO_CACHE_TTL):
+            return None
+        return copy.deepcopy(entry["info"])
+
+
+def _store_cached_infos(infos):
+    """Remember successful fetches ({mod_id: info}) in memory and write the cache file atomically, once."""
+    if not infos:
+        return
+    with _info_cache_lock:
+        cache = _load_info_cache()
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        for mod_id, info in infos.items():
+            cache[mod_id] = {"fetched_at": fetched_at, "info": copy.deepcopy(info)}
+        try:
+            os.makedirs(os.path.dirname(config.MOD_INFO_CACHE_FILE), exist_ok=True)
+            tmp_path = config.MOD_INFO_CACHE_FILE + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, config.MOD_INFO_CACHE_FILE)
+        except OSError as e:
+            print(f"Warning: Could not write mod info cache: {e}")
+
 
 class SteamAPI:
     """Handles communication with Steam API and workshop page scraping."""
 
+    # Shared workers for the network-bound page scrapes and description fetches.
+    _pool = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="steamfetch")
+
+    # Shared keep-alive session so concurrent fetches reuse pooled connections instead of new TLS handshakes.
+    _session = None
+    _session_closed = False
+    _session_lock = threading.Lock()
+
+    # requests is imported on first use so it doesn't slow down window startup.
+    _requests = None
+
+    @classmethod
+    def _get_requests(cls):
+        """Return the requests module, importing it on first use."""
+        if cls._requests is None:
+            import requests
+            cls._requests = requests
+        return cls._requests
+
+    @classmethod
+    def _get_session(cls):
+        """Return the shared HTTP session, creating it on first use. Raises RuntimeError once it has been closed."""
+        with cls._session_lock:
+            if cls._session_closed:
+                raise RuntimeError("HTTP session is closed")
+            if cls._session is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                session = cls._get_requests().Session()
+                adapter = HTTPAdapter(pool_connections=config.HTTP_POOL_SIZE, pool_maxsize=config.HTTP_POOL_SIZE,
+                                      max_retries=Retry(total=2, backoff_factor=0.3,
+                                                        status_forcelist=(429, 500, 502, 503, 504)))
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def close_session(cls):
+        """Close the shared HTTP session for good, dropping its idle pooled connections."""
+        with cls._session_lock:
+            cls._session_closed = True
+            session, cls._session = cls._session, None
+        if session is not None:
+            session.close()
+
+    @classmethod
+    def shutdown(cls):
+        """Stop the shared fetch pool, cancelling any fetches that have not started yet."""
+        cls._pool.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def fetch_mod_info(mod_id):
-        """Fetch title, app_id & other details from Steam API and scrape page for dependencies."""
-        try:
+        """Fetch mod details, served from the local cache when a fresh entry exists. Errors are not cached."""
+        return SteamAPI.fetch_mod_info_batch([mod_id])[mod_id]
 
-            response = requests.post(config.STEAM_API_URL, data={"itemcount": 1, "publishedfileids[0]": mod_id}, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+    @staticmethod
+    def fetch_mod_info_batch(mod_ids):
+        """Fetch details for many mods, returning {mod_id: info}."""
+        return dict(SteamAPI.fetch_many(mod_ids))
 
-            if not data.get("response", {}).get("publishedfiledetails"):
-                return {"title": f"Mod {mod_id}", "error": "No details in API response."}
+    @staticmethod
+    def fetch_many(mod_ids):
+        """
+        Fetch details for many mods, yielding (mod_id, info) pairs as each one completes.
+        Cached entries are yielded first; the rest share one API request per batch, and their workshop
+        pages (needed for dependencies) are scraped concurrently on the shared pool.
+        """
+        missing = []
+        for mod_id in dict.fromkeys(mod_ids):
+            info = _get_cached_info(mod_id)
+            if info is None:
+                missing.append(mod_id)
+            else:
+                yield mod_id, info
 
-            details = data["response"]["publishedfiledetails"][0]
+        for start in range(0, len(missing), config.STEAM_API_BATCH_SIZE):
+            chunk = missing[start:start + config.STEAM_API_BATCH_SIZE]
+            details_by_id = SteamAPI._fetch_details(chunk)
 
-            if details.get("result") != 1:
-                return {"title": f"Mod {mod_id}", "error": f"API result not OK (result code: {details.get('result')})"}
+            futures = {}
+            for mod_id in chunk:
+                details = details_by_id[mod_id]
+                if "error" in details:
+                    yield mod_id, details
+                else:
+                    futures[SteamAPI._pool.submit(SteamAPI._fetch_dependencies, mod_id)] = mod_id
 
-            dependencies = []
-            workshop_url = f"https://steamcommunity.com/workshop/filedetails/?id={mod_id}"
+            fetched = {}
             try:
-                page_response = requests.get(workshop_url, timeout=10)
-                page_response.raise_for_status()
-                try:
-
-                    soup = BeautifulSoup(page_response.text, 'lxml')
-                except FeatureNotFound:
-
-                    print(
-                        "Warning: 'lxml' parser not found. Falling back to 'html.parser'. For better performance, run: pip install lxml")
-                    soup = BeautifulSoup(page_response.text, 'html.parser')
-
-                required_items_div = soup.find('div', id='RequiredItems')
-                if required_items_div:
-                    for link in required_items_div.find_all('a'):
-                        href = link.get('href')
-                        if href and (match := re.search(r"id=(\d+)", href)):
-                            dependencies.append(match.group(1))
-            except Exception as scrape_error:
-
-                print(f"Warning: Could not scrape dependencies for {mod_id}: {scrape_error}")
-
-            description = details.get("description", "")
-            if description:
-                description = html.unescape(description)
-
-            return {"title": details.get("title", "Unknown"), "app_id": details.get("consumer_app_id"),
-                    "preview_url": details.get("preview_url", ""), "file_size": details.get("file_size", 0),
-                    "description": description, "dependencies": dependencies, }
+                for future in concurrent.futures.as_completed(futures):
+                    mod_id = futures[future]
+                    dependencies = future.result()
+                    info = SteamAPI._build_info(details_by_id[mod_id], dependencies or [])
+                    # A failed page scrape still yields the details, but isn't cached so it is retried next time.
+                    if dependencies is not None:
+                        fetched[mod_id] = info
+                    yield mod_id, info
+            finally:
+                _store_cached_infos(fetched)
+
+    @staticmethod
+    def _details_request_data(mod_ids):
+        """Form data for a GetPublishedFileDetails request covering mod_ids."""
+        data = {"itemcount": len(mod_ids)}
+        for i, mod_id in enumerate(mod_ids):
+            data[f"publishedfileids[{i}]"] = mod_id
+        return data
+
+    @staticmethod
+    def _fetch_details(mod_ids):
+        """Fetch raw published file details for mod_ids in one request. Failures map to error info dicts."""
+        requests = SteamAPI._get_requests()
+        try:
+            response = SteamAPI._get_session().post(config.STEAM_API_URL, data=SteamAPI._details_request_data(mod_ids),
+                                                    timeout=10)
+            response.raise_for_status()
+            data = _json_loads(response.content)
         except requests.exceptions.RequestException as e:
-            return {"title": f"Mod {mod_id}", "error": f"Network error: {e}"}
+            return {mod_id: {"title": f"Mod {mod_id}", "error": f"Network error: {e}"} for mod_id in mod_ids}
         except Exception as e:
-            return {"title": f"Mod {mod_id}", "error": str(e)}
+            return {mod_id: {"title": f"Mod {mod_id}", "error": str(e)} for mod_id in mod_ids}
+
+        details_list = data.get("response", {}).get("publishedfiledetails") or []
+        details_by_id = {str(details.get("publishedfileid")): details for details in details_list}
+
+        results = {}
+        for mod_id in mod_ids:
+            details = details_by_id.get(mod_id)
+            if details is None:
+                results[mod_id] = {"title": f"Mod {mod_id}", "error": "No details in API response."}
+            elif details.get("result") != 1:
+                results[mod_id] = {"title": f"Mod {mod_id}",
+                                   "error": f"API result not OK (result code: {details.get('result')})"}
+            else:
+                results[mod_id] = details
+        return results
+
+    @staticmethod
+    def _build_info(details, dependencies):
+        """Shape raw published file details and scraped dependencies into the stored mod info."""
+        description = details.get("description", "")
+        if description:
+            description = _unescape(description)
+
+        return {"title": details.get("title", "Unknown"), "app_id": details.get("consumer_app_id"),
+                "preview_url": details.get("preview_url", ""), "file_size": details.get("file_size", 0),
+                "description": description, "dependencies": dependencies, }
+
+    @staticmethod
+    def _fetch_dependencies(mod_id):
+        """Scrape a mod's workshop page for its required items. Returns None if the page cannot be read."""
+        workshop_url = f"https://steamcommunity.com/workshop/filedetails/?id={mod_id}"
+        try:
+            page_response = SteamAPI._get_session().get(workshop_url, timeout=10)
+            page_response.raise_for_status()
+            return _scrape_dependency_ids(page_response.text)
+        except Exception as scrape_error:
+            print(f"Warning: Could not scrape dependencies for {mod_id}: {scrape_error}")
+            return None
 
     @staticmethod
     def fetch_mod_description(mod_id):
         """Fetch only the description for a mod using the Steam API."""
         try:
-            response = requests.post(config.STEAM_API_URL, data={"itemcount": 1, "publishedfileids[0]": mod_id}, timeout=10)
+            response = SteamAPI._get_session().post(config.STEAM_API_URL, data=SteamAPI._details_request_data([mod_id]),
+                                                    timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
 
             if data.get("response", {}).get("publishedfiledetails"):
                 details = data["response"]["publishedfiledetails"][0]
                 if details.get("result") == 1:
                     description = details.get("description", "")
                     if description:
-                        return html.unescape(description)
+                        return _unescape(description)
             return None
         except Exception as e:
             print(f"Warning: Could not fetch description for {mod_id}: {e}")
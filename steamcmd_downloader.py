@@ -1,12 +1,23 @@
 import os
 import re
 import subprocess
+import sys
 import threading
 import time
 from typing import List, Dict, Callable, Optional
 
 from config import STEAMCMD_PATH
 
+# The SteamCMD output markers the monitor acts on, in one pattern so each line is scanned once; m.lastgroup names
+# the marker. Any output at all counts as activity for the stall timeout, so no pattern is needed for that.
+# Output is matched as raw bytes; only lines that get logged are decoded.
+_LINE_RE = re.compile(rb'(?P<start>downloading item (?P<item>\d+))|(?P<success>success\.)|(?P<error>error|failed|timeout)',
+                      re.IGNORECASE)
+_QUIT_MARKER = b"-- type 'quit' to exit --"
+
+# Keep SteamCMD from opening a console window on Windows.
+_POPEN_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0) if os.name == 'nt' else 0
+
 
 class SteamCMDDownloader:
     """Handles SteamCMD download operations with improved threading and error handling."""
@@ -14,6 +25,8 @@ class SteamCMDDownloader:
     def __init__(self, steamcmd_path: str = STEAMCMD_PATH):
         self.steamcmd_path = steamcmd_path
         self._stop_requested = False
+        # (path, time.monotonic()) of the last check that found SteamCMD; failures are never cached.
+        self._available_checked = None
 
     def download_mods(self, mods: List[Dict], progress_callback: Optional[Callable] = None,
                       log_callback: Optional[Callable] = None, status_callback: Optional[Callable] = None) -> Dict:
@@ -69,15 +82,19 @@ class SteamCMDDownloader:
         if log_callback:
             log_callback(f"--- Starting batch download for {len(valid_mods)} mod(s) ---\n")
 
+        # Queue items grouped by game (in first-seen order) so SteamCMD handles each app's items back to back.
+        mods_by_app = {}
+        for mod in valid_mods:
+            mods_by_app.setdefault(str(mod["info"]["app_id"]), []).append(mod)
+
         command = [self.steamcmd_path, "+login", "anonymous"]
 
-        for mod in valid_mods:
-            app_id = mod["info"]["app_id"]
-            mod_id = mod["id"]
-            title = mod["info"].get('title', mod_id)
-            if log_callback:
-                log_callback(f"Queuing: {title} ({mod_id})\n")
-            command.extend(["+workshop_download_item", str(app_id), mod_id])
+        for app_id, app_mods in mods_by_app.items():
+            for mod in app_mods:
+                mod_id = mod["id"]
+                if log_callback:
+                    log_callback(f"Queuing: {mod['info'].get('title', mod_id)} ({mod_id})\n")
+                command.extend(("+workshop_download_item", app_id, mod_id))
 
         command.append("+quit")
 
@@ -115,14 +132,12 @@ class SteamCMDDownloader:
 
         try:
 
-            flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-
             if log_callback:
                 log_callback(f"Executing command: {' '.join(command[:5])}... [truncated]\n")
 
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
-                                       encoding='utf-8', errors='replace', creationflags=flags, bufsize=1,
-                                       universal_newlines=True)
+            # Unbuffered binary pipe: _iter_output_lines reads it directly in 64 KiB chunks.
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       creationflags=_POPEN_FLAGS, bufsize=0)
 
             completed_downloads = 0
             successful_downloads = 0
@@ -130,60 +145,67 @@ class SteamCMDDownloader:
             last_activity = time.time()
             timeout_seconds = 300
 
-            download_patterns = {'start': re.compile(r'downloading item (\d+)', re.IGNORECASE),
-                                 'success': re.compile(r'success\.', re.IGNORECASE),
-                                 'error': re.compile(r'error|failed|timeout', re.IGNORECASE),
-                                 'progress': re.compile(r'(\d+)%', re.IGNORECASE),
-                                 'downloading': re.compile(r'downloading', re.IGNORECASE),
-                                 'login': re.compile(r'logged in OK', re.IGNORECASE),
-                                 'workshop': re.compile(r'workshop', re.IGNORECASE)}
-
+            # ModManager interns mod ids; the ids parsed from SteamCMD output are interned to match.
             mods_by_id = {mod['id']: mod for mod in valid_mods}
 
             if progress_callback:
                 progress_callback(0, len(valid_mods))
 
-            output_lines = []
-            process_finished = False
-
-            def read_output():
-                """Read output in a separate thread to prevent blocking."""
-                try:
-                    for line in iter(process.stdout.readline, ''):
-                        if not line:
-                            break
-                        output_lines.append(line)
-                        if len(output_lines) > 1000:
-                            output_lines.pop(0)
-                except Exception as e:
-                    if log_callback:
-                        log_callback(f"Error reading output: {e}\n")
-
-            output_thread = threading.Thread(target=read_output, daemon=True)
-            output_thread.start()
-
-            processed_lines = 0
             startup_grace_period = 30
             startup_time = time.time()
+            monitor_done = threading.Event()
 
-            while process.poll() is None and not self._stop_requested:
-                current_time = time.time()
-
-                while processed_lines < len(output_lines):
-                    line = output_lines[processed_lines]
-                    processed_lines += 1
-                    last_activity = current_time
-
-                    if "-- type 'quit' to exit --" not in line.lower():
+            def terminate():
+                """Ask SteamCMD to exit, killing it if it is still running after 10 seconds."""
+                try:
+                    process.terminate()
+                    process.wait(timeout=10)
+                except:
+                    try:
+                        process.kill()
+                    except:
+                        pass
+
+            def watchdog():
+                """Terminate SteamCMD on a stop request or a stall; the read loop below then ends at EOF."""
+                while not monitor_done.wait(0.5):
+                    current_time = time.time()
+                    stalled = (current_time - startup_time > startup_grace_period and
+                               current_time - last_activity > timeout_seconds)
+                    if not stalled and not self._stop_requested:
+                        continue
+                    if stalled:
                         if log_callback:
-                            log_callback(line)
+                            log_callback("--- Timeout: No activity detected for 5 minutes, terminating process ---\n")
+                        if status_callback:
+                            status_callback("Download timeout - terminating process")
+                    terminate()
+                    return
+
+            watchdog_thread = threading.Thread(target=watchdog, daemon=True)
+            watchdog_thread.start()
 
-                    if any(pattern.search(line) for pattern in download_patterns.values()):
-                        last_activity = current_time
+            try:
+                for line in self._iter_output_lines(process.stdout.fileno()):
+                    current_time = time.time()
+                    last_activity = current_time
 
-                    start_match = download_patterns['start'].search(line)
-                    if start_match:
-                        downloading_id = start_match.group(1)
+                    # Only lines containing "--" can hold the prompt, so most lines skip the lower() copy.
+                    if log_callback and not (b"--" in line and _QUIT_MARKER in line.lower()):
+                        log_callback(line.decode('utf-8', 'replace'))
+
+                    downloading_id = None
+                    is_success = is_error = False
+                    for match in _LINE_RE.finditer(line):
+                        kind = match.lastgroup
+                        if kind == 'start':
+                            downloading_id = downloading_id or sys.intern(match.group('item').decode('ascii'))
+                        elif kind == 'success':
+                            is_success = True
+                        elif kind == 'error':
+                            is_error = True
+
+                    if downloading_id:
                         if downloading_id in mods_by_id:
                             current_mod_info = mods_by_id[downloading_id]
                             title = current_mod_info["info"].get('title', downloading_id)
@@ -193,9 +215,6 @@ class SteamCMDDownloader:
                                 log_callback(f"--- Starting download: {title} ({downloading_id}) ---\n")
 
                     if current_mod_info:
-                        is_success = download_patterns['success'].search(line)
-                        is_error = download_patterns['error'].search(line)
-
                         if is_success or is_error:
                             completed_downloads += 1
                             title = current_mod_info["info"].get('title', current_mod_info["id"])
@@ -221,8 +240,7 @@ class SteamCMDDownloader:
                             current_mod_info = None
 
 
-                    elif not current_mod_info and (
-                            download_patterns['success'].search(line) or download_patterns['error'].search(line)):
+                    elif not current_mod_info and (is_success or is_error):
 
                         if completed_downloads < len(valid_mods):
                             completed_downloads += 1
@@ -231,31 +249,17 @@ class SteamCMDDownloader:
                             if progress_callback:
                                 progress_callback(completed_downloads, len(valid_mods))
 
-                if current_time - startup_time > startup_grace_period:
-                    if current_time - last_activity > timeout_seconds:
-                        if log_callback:
-                            log_callback("--- Timeout: No activity detected for 5 minutes, terminating process ---\n")
-                        if status_callback:
-                            status_callback("Download timeout - terminating process")
-                        try:
-                            process.terminate()
-                            process.wait(timeout=10)
-                        except:
-                            try:
-                                process.kill()
-                            except:
-                                pass
+                    if self._stop_requested:
                         break
+            except Exception as e:
+                if log_callback:
+                    log_callback(f"Error reading output: {e}\n")
+            finally:
+                monitor_done.set()
 
-                time.sleep(0.02)
-
-            output_thread.join(timeout=5)
-
-            while processed_lines < len(output_lines):
-                line = output_lines[processed_lines]
-                processed_lines += 1
-                if log_callback and "-- type 'quit' to exit --" not in line.lower():
-                    log_callback(line)
+            # A stop request can end the loop before the watchdog's next check; don't wait on a live process.
+            if self._stop_requested and process.poll() is None:
+                terminate()
 
             try:
                 return_code = process.wait(timeout=30)
@@ -301,10 +305,42 @@ class SteamCMDDownloader:
                 status_callback(error_msg)
             return {'completed': 0, 'successful': 0, 'failed_ids': failed_ids, 'failed_details': failed_details}
 
+    @staticmethod
+    def _iter_output_lines(fd):
+        """
+        Yield lines of raw output from fd until EOF, each ending in a newline except possibly the last.
+        As with text-mode universal newlines, CRLF and a lone CR both end a line.
+        """
+        pending = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            data = pending + chunk
+            # Hold back a trailing CR in case the next chunk starts with its LF.
+            held = b"\r" if data.endswith(b"\r") else b""
+            if held:
+                data = data[:-1]
+            lines = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+            pending = lines.pop() + held
+            for line in lines:
+                yield line + b"\n"
+        if pending:
+            if pending.endswith(b"\r"):
+                yield pending[:-1] + b"\n"
+            else:
+                yield pending
+
     def stop_download(self):
         """Request to stop the current download."""
         self._stop_requested = True
 
     def is_steamcmd_available(self) -> bool:
-        """Check if SteamCMD is available at the specified path."""
-        return os.path.exists(self.steamcmd_path)
+        """Check if SteamCMD is available at the specified path. A positive result is reused for 5 seconds."""
+        checked = self._available_checked
+        if checked and checked[0] == self.steamcmd_path and time.monotonic() - checked[1] < 5:
+            return True
+        if os.path.isfile(self.steamcmd_path):
+            self._available_checked = (self.steamcmd_path, time.monotonic())
+            return True
+        return False
@@ -0,0 +1,119 @@
+import unittest
+
+from bbcode_parser import BBCodeParser, HTML_PREFIX, HTML_SUFFIX, MAX_PARSE_BRACKETS, MAX_PARSE_LENGTH
+
+
+def render(text):
+    """Parse text and return just the body, without the page template."""
+    html = BBCodeParser.parse(text)
+    assert html.startswith(HTML_PREFIX) and html.endswith(HTML_SUFFIX), html
+    return html[len(HTML_PREFIX):-len(HTML_SUFFIX)]
+
+
+class BaselineCompatibilityTests(unittest.TestCase):
+    """Inputs the tokenizer renders exactly as the original per-tag regex parser did."""
+
+    CASES = {
+        '[b]bold [i]both[/i][/b]': '<strong>bold <em>both</em></strong>',
+        '[B]up[/b]': '<strong>up</strong>',
+        '[hr]': '<hr>',
+        '<script>&"\'': '&lt;script&gt;&amp;&quot;&#x27;',
+        'line1\r\nline2\nline3': 'line1<br>line2<br>line3',
+        '[url=http://a]t[/url]': '<a href="http://a" target="_blank">t</a>',
+        '[img=10x20]http://a/b.png[/img]':
+            '<img src="http://a/b.png" width="10" height="20" style="max-width: 100%; height: auto;" alt="Image">',
+        '[quote=Bob]hi[/quote]':
+            '<blockquote style="border-left: 4px solid #ccc; margin: 10px 0; padding: 10px; background: #f9f9f9; '
+            'border-radius: 4px;"><strong>Bob said:</strong><br>hi</blockquote>',
+        # Unclosed, stray closing and unknown tags stay literal.
+        '[b]unclosed': '[b]unclosed',
+        '[i]x[/i] [b]y': '<em>x</em> [b]y',
+        '[/b]stray': '[/b]stray',
+        '[unknown]x[/unknown]': '[unknown]x[/unknown]',
+        # Misnested, with no later closing tag for the inner element.
+        '[b]a [i]b[/b] c': '<strong>a [i]b</strong> c',
+    }
+
+    def test_cases(self):
+        for text, expected in self.CASES.items():
+            with self.subTest(text=text):
+                self.assertEqual(render(text), expected)
+
+
+class IntendedDifferenceTests(unittest.TestCase):
+    """Inputs where the output deliberately differs from the original parser (shown in each comment)."""
+
+    def test_same_tag_nesting(self):
+        # Was: <strong>[b]x</strong>[/b]
+        self.assertEqual(render('[b][b]x[/b][/b]'), '<strong><strong>x</strong></strong>')
+
+    def test_every_list_item_is_closed(self):
+        # Was: <ul><li>one</li>[*]two</ul>
+        self.assertEqual(render('[list][*]one[*]two[/list]'), '<ul><li>one</li><li>two</li></ul>')
+        self.assertEqual(render('[list=a][*]x[/list]'), '<ol style="list-style-type: lower-alpha;"><li>x</li></ol>')
+
+    def test_code_body_is_verbatim(self):
+        # Was: ...<code><strong>x</strong></code>...
+        self.assertIn('<code>[b]x[/b]</code>', render('[code][b]x[/b][/code]'))
+
+    def test_misnested_tags_produce_well_formed_html(self):
+        # Was: <strong>a <em>b</strong> c</em>, which browsers repaired to the same rendering.
+        self.assertEqual(render('[b]a [i]b[/b] c[/i]'), '<strong>a <em>b</em></strong><em> c</em>')
+        self.assertEqual(render('[color=red][b]x[/color][/b]'), '<span style="color: red;"><strong>x</strong></span>')
+        self.assertEqual(render('[b]1[i]2[u]3[/b]4[/i]5[/u]'),
+                         '<strong>1<em>2<u>3</u></em></strong><em><u>4</u></em><u>5</u>')
+
+    def test_misnested_tag_with_invalid_attribute_stays_literal(self):
+        self.assertEqual(render('[b]x[size=abc]y[/b]z[/size]'), '<strong>x[size=abc]y</strong>z[/size]')
+
+
+class LimitTests(unittest.TestCase):
+
+    def test_empty_description(self):
+        self.assertEqual(BBCodeParser.parse(''), '<p>No description available.</p>')
+
+    def test_plain_text(self):
+        self.assertEqual(render('a < b'), 'a &lt; b')
+
+    def test_too_long_is_preformatted(self):
+        text = '[b]x[/b]' + 'a' * MAX_PARSE_LENGTH
+        self.assertEqual(render(text), '<pre>' + text + '</pre>')
+
+    def test_at_length_limit_is_parsed(self):
+        text = '[b]x[/b]' + 'a' * (MAX_PARSE_LENGTH - 8)
+        self.assertTrue(render(text).startswith('<strong>x</strong>'))
+
+    def test_too_many_brackets_is_preformatted(self):
+        text = '[b]<[/b]' * (MAX_PARSE_BRACKETS // 2 + 1)
+        self.assertEqual(render(text), '<pre>' + text.replace('<', '&lt;') + '</pre>')
+
+    def test_at_bracket_limit_is_parsed(self):
+        text = '[b]x[/b]' * (MAX_PARSE_BRACKETS // 2)
+        self.assertEqual(render(text), '<strong>x</strong>' * (MAX_PARSE_BRACKETS // 2))
+
+
+class SizeTagTests(unittest.TestCase):
+
+    def test_common_size(self):
+        self.assertEqual(render('[size=3]x[/size]'), '<span style="font-size: 0.6em;">x</span>')
+
+    def test_size_is_clamped(self):
+        self.assertEqual(render('[size=100]x[/size]'), '<span style="font-size: 2.0em;">x</span>')
+
+    def test_non_ascii_digit_stays_literal(self):
+        # '²'.isdigit() is true but int('²') raises.
+        self.assertEqual(render('[size=²]x[/size]'), '[size=²]x[/size]')
+
+    def test_other_script_decimal_digits_are_sizes(self):
+        self.assertEqual(render('[size=٣]x[/size]'), '<span style="font-size: 0.6em;">x</span>')
+
+    def test_huge_size_stays_literal(self):
+        self.assertEqual(render('[size=99999]x[/size]'), '[size=99999]x[/size]')
+        self.assertEqual(render(f'[size={"9" * 5000}]x[/size]'), f'[size={"9" * 5000}]x[/size]')
+
+    def test_non_numeric_size_stays_literal(self):
+        self.assertEqual(render('[size=abc]x[/size]'), '[size=abc]x[/size]')
+
+
+if __name__ == '__main__':
+    unittest.main()
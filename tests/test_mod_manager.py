@@ -0,0 +1,189 @@
+import contextlib
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from mod_manager import ModManager
+
+
+class ModManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = self._tmp.name
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def manager(self, name="mods.json.gz"):
+        manager = ModManager(self.path(name))
+        self.addCleanup(manager.flush)
+        return manager
+
+    @staticmethod
+    def read_catalog(path):
+        with open(path, "rb") as f:
+            content = f.read()
+        if content[:2] == b"\x1f\x8b":
+            content = gzip.decompress(content)
+        return json.loads(content)
+
+
+class FlushTests(ModManagerTestCase):
+
+    def test_flush_writes_gzip_without_derived_fields(self):
+        manager = self.manager()
+        manager.add_mod_by_id("111")
+        manager.save_mods()
+        manager.flush()
+
+        with open(self.path("mods.json.gz"), "rb") as f:
+            self.assertEqual(f.read(2), b"\x1f\x8b")
+        mods = self.read_catalog(self.path("mods.json.gz"))
+        self.assertEqual([mod["id"] for mod in mods], ["111"])
+        self.assertFalse([key for key in mods[0] if key.startswith("_")])
+        self.assertFalse(os.path.exists(self.path("mods.json.gz.tmp")))
+
+    def test_plain_json_path_is_not_compressed(self):
+        manager = self.manager("mods.json")
+        manager.add_mod_by_id("111")
+        manager.save_mods()
+        manager.flush()
+
+        with open(self.path("mods.json"), "rb") as f:
+            self.assertEqual(json.loads(f.read())[0]["id"], "111")
+
+    def test_flush_without_changes_writes_nothing(self):
+        self.manager().flush()
+        self.assertFalse(os.path.exists(self.path("mods.json.gz")))
+
+    def test_failed_write_stays_dirty(self):
+        manager = self.manager(os.path.join("missing", "mods.json.gz"))
+        manager.add_mod_by_id("111")
+        manager.save_mods()
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            manager.flush()
+        self.assertIn("Warning: Could not save mods", output.getvalue())
+
+        os.mkdir(self.path("missing"))
+        manager.flush()
+        mods = self.read_catalog(self.path(os.path.join("missing", "mods.json.gz")))
+        self.assertEqual([mod["id"] for mod in mods], ["111"])
+
+    def test_round_trip(self):
+        manager = self.manager()
+        manager.add_mod_by_id("111")
+        manager.add_mod_by_id("222", is_dependency=True)
+        manager.update_mod_info("111", {"title": "Main", "dependencies": ["222"]})
+        manager.save_mods()
+        manager.flush()
+
+        reloaded = self.manager()
+        self.assertEqual([mod["id"] for mod in reloaded.get_all_mods()], ["111", "222"])
+        self.assertEqual(reloaded.get_mod_by_id("111")["info"]["title"], "Main")
+        self.assertTrue(reloaded.get_mod_by_id("222")["is_dependency"])
+        self.assertEqual([mod["id"] for mod in reloaded.find_dependents("222")], ["111"])
+
+
+class LegacyCatalogTests(ModManagerTestCase):
+
+    LEGACY = [{"id": 111, "url": "https://steamcommunity.com/workshop/filedetails/?id=111",
+               "info": {"title": "Old", "dependencies": [222]}},
+              {"id": "222", "info": None}]
+
+    def write_legacy(self, name):
+        with open(self.path(name), "w", encoding="utf-8") as f:
+            json.dump(self.LEGACY, f)
+
+    def test_plain_catalog_is_migrated_to_gzip(self):
+        self.write_legacy("mods.json")
+        manager = self.manager()
+        self.assertEqual([mod["id"] for mod in manager.get_all_mods()], ["111", "222"])
+
+        # Nothing changed, but the first flush still writes the compressed catalog.
+        manager.flush()
+        mods = self.read_catalog(self.path("mods.json.gz"))
+        self.assertEqual([mod["id"] for mod in mods], ["111", "222"])
+        self.assertEqual(mods[0]["info"]["dependencies"], ["222"])
+        self.assertEqual(mods[1]["info"], {})
+        self.assertFalse(mods[1]["is_dependency"])
+
+    def test_compressed_catalog_wins_over_legacy_file(self):
+        self.write_legacy("mods.json")
+        with open(self.path("mods.json.gz"), "wb") as f:
+            f.write(gzip.compress(json.dumps([{"id": "333", "url": "", "info": {}}]).encode("utf-8")))
+
+        manager = self.manager()
+        self.assertEqual([mod["id"] for mod in manager.get_all_mods()], ["333"])
+
+    def test_format_is_detected_from_content(self):
+        # A plain JSON file under the .gz name is still read.
+        self.write_legacy("mods.json.gz")
+        self.assertEqual(self.manager().get_mods_count(), 2)
+
+    def test_record_without_url_loads(self):
+        with open(self.path("mods.json.gz"), "w", encoding="utf-8") as f:
+            json.dump([{"id": "111", "info": {"title": "No url"}}], f)
+        self.assertEqual(self.manager().get_mod_by_id("111")["info"]["title"], "No url")
+
+
+class ReverseDependencyTests(ModManagerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mods = self.manager()
+        for mod_id in ("1", "2", "3", "9"):
+            self.mods.add_mod_by_id(mod_id)
+
+    def dependents(self, mod_id):
+        return [mod["id"] for mod in self.mods.find_dependents(mod_id)]
+
+    def test_update_links_and_unlinks_dependencies(self):
+        self.mods.update_mod_info("1", {"dependencies": ["9"]})
+        self.assertEqual(self.dependents("9"), ["1"])
+
+        self.mods.update_mod_info("1", {"dependencies": ["2"]})
+        self.assertEqual(self.dependents("9"), [])
+        self.assertEqual(self.dependents("2"), ["1"])
+
+        self.mods.update_mod_info("1", {})
+        self.assertEqual(self.dependents("2"), [])
+
+    def test_removed_mod_is_no_longer_a_dependent(self):
+        self.mods.update_mod_info("1", {"dependencies": ["9"]})
+        self.mods.update_mod_info("2", {"dependencies": ["9"]})
+        self.mods.remove_mod("1")
+        self.assertEqual(self.dependents("9"), ["2"])
+
+        self.mods.remove_mod_by_index(0)
+        self.assertEqual(self.dependents("9"), [])
+
+    def test_dependents_are_in_catalog_order(self):
+        for mod_id in ("3", "1", "2"):
+            self.mods.update_mod_info(mod_id, {"dependencies": ["9"]})
+        self.assertEqual(self.dependents("9"), ["1", "2", "3"])
+
+        self.mods.remove_mod("1")
+        self.mods.add_mod_by_id("1")
+        self.mods.update_mod_info("1", {"dependencies": ["9"]})
+        self.assertEqual(self.dependents("9"), ["2", "3", "1"])
+
+    def test_integer_ids_match_string_ids(self):
+        self.mods.update_mod_info("1", {"dependencies": [9]})
+        self.assertEqual(self.dependents("9"), ["1"])
+        self.assertFalse(self.mods.add_mod_by_id(9))
+
+    def test_dependency_change_invalidates_snapshot(self):
+        before = self.mods.get_all_mods()
+        self.mods.update_mod_info("1", {"title": "x"})
+        self.assertIs(self.mods.get_all_mods(), before)
+        self.mods.update_mod_info("1", {"dependencies": ["9"]})
+        self.assertIsNot(self.mods.get_all_mods(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,14 @@ from tkinter import ttk
 import config
 
 
+def _format_size(size_bytes):
+    """Format a byte count as MB, or GB from 1024 MB up."""
+    size_mb = size_bytes / 1048576
+    if size_mb >= 1024:
+        return f"{size_mb / 1024:.2f} GB"
+    return f"{size_mb:.2f} MB"
+
+
 class WindowHelper:
     """Helper functions for window positioning and management."""
 
@@ -61,6 +69,11 @@ class LogPopup:
         self.current_download = 0
         self.total_downloads = total_mods
 
+        # Log text is buffered and written to the widget at most every 100ms.
+        self._pending_log = []
+        self._flush_after_id = None
+        self._see_after_id = None
+
     def _setup_ui(self, total_mods):
         """Setup the UI components."""
 
@@ -95,13 +108,35 @@ class LogPopup:
 
     def add_log(self, message):
         """Add a message to the log."""
+        self._pending_log.append(message)
+        if self._flush_after_id is None:
+            self._flush_after_id = self.popup.after(100, self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered log text to the widget in one insert."""
+        self._flush_after_id = None
+        if not self._pending_log:
+            return
+        text = "".join(self._pending_log)
+        self._pending_log.clear()
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message)
-        self.log_text.see(tk.END)
+        self.log_text.insert(tk.END, text)
         self.log_text.config(state=tk.DISABLED)
+        # Scrolling forces a layout pass; leave it until pending events (e.g. progress updates) are handled.
+        if self._see_after_id is None:
+            self._see_after_id = self.popup.after_idle(self._scroll_to_end)
+
+    def _scroll_to_end(self):
+        """Scroll the log to its last line."""
+        self._see_after_id = None
+        self.log_text.see(tk.END)
 
     def destroy(self):
         """Destroy the popup window."""
+        for after_id in (self._flush_after_id, self._see_after_id):
+            if after_id is not None:
+                self.popup.after_cancel(after_id)
+        self._flush_after_id = self._see_after_id = None
         self.popup.destroy()
 
 
@@ -123,8 +158,29 @@ class DescriptionPopup:
 
         self.description = description
         self.bbcode_parser = bbcode_parser
+        self._parsed_html = None
+        # HTML written for "Open in Browser"; removed when the popup goes away.
+        self._temp_file = None
+        self.popup.bind("<Destroy>", self._on_destroy)
         self._setup_ui()
 
+    def _get_parsed_html(self):
+        """Return the description rendered to HTML, parsing it on first use."""
+        if self._parsed_html is None:
+            self._parsed_html = self.bbcode_parser.parse(self.description)
+        return self._parsed_html
+
+    def _on_destroy(self, event):
+        """Delete the temp HTML file once the popup window itself is destroyed."""
+        # Child widgets' <Destroy> events also reach the toplevel's binding.
+        if event.widget is not self.popup or self._temp_file is None:
+            return
+        try:
+            os.unlink(self._temp_file)
+        except OSError:
+            pass
+        self._temp_file = None
+
     def _setup_ui(self):
         """Setup the UI components."""
 
@@ -135,11 +191,12 @@ class DescriptionPopup:
 
         if config.TKINTERWEB_AVAILABLE:
             try:
-                html_view = config.tkweb.HtmlFrame(frame)
+                import tkinterweb
+
+                html_view = tkinterweb.HtmlFrame(frame)
                 html_view.pack(fill=tk.BOTH, expand=True)
 
-                parsed_html = self.bbcode_parser.parse(self.description)
-                html_view.load_html(parsed_html)
+                html_view.load_html(self._get_parsed_html())
                 webview_created = True
             except Exception as e:
                 print(f"tkinterweb failed: {e}")
@@ -180,22 +237,13 @@ class DescriptionPopup:
         button_frame.pack(fill=tk.X, pady=(5, 0))
 
         def open_in_browser():
-            """Save HTML to temp file and open in browser."""
-            parsed_html = self.bbcode_parser.parse(self.description)
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(parsed_html)
-                temp_file = f.name
-
-            webbrowser.open(f'file://{temp_file}')
+            """Save HTML to a temp file (once per popup) and open it in the browser."""
+            if self._temp_file is None:
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
+                    f.write(self._get_parsed_html())
+                    self._temp_file = f.name
 
-            def cleanup():
-                try:
-                    os.unlink(temp_file)
-                except:
-                    pass
-
-            self.popup.after(5000, cleanup)
+            webbrowser.open(f'file://{self._temp_file}')
 
         open_browser_button = tk.Button(button_frame, text="Open in Browser", command=open_in_browser)
         open_browser_button.pack(side=tk.LEFT, padx=(0, 5))
@@ -213,6 +261,11 @@ class ModInfoWidget:
         self._setup_ui()
         self.view_desc_callback = None
 
+        # Lookups over the last all_mods snapshot seen; rebuilt when a new snapshot is passed in.
+        self._all_mods_ref = None
+        self._id_index = {}
+        self._required_by = {}
+
     def _setup_ui(self):
         """Setup the UI components."""
 
@@ -287,6 +340,9 @@ class ModInfoWidget:
             self._set_text("")
             return
 
+        if all_mods is not self._all_mods_ref:
+            self._index_mods(all_mods)
+
         info = mod.get("info", {})
 
         if info.get("title", "").startswith("Fetching info for"):
@@ -317,35 +373,13 @@ class ModInfoWidget:
 
         self.view_desc_button.config(state=tk.DISABLED)
 
-        total_size = 0
-        valid_size_count = 0
-        main_mods = 0
-        dependencies = 0
+        sizes = [mod['_index'].file_size for mod in selected_mods]
+        total_size = sum(size for size in sizes if size > 0)
+        valid_size_count = sum(1 for size in sizes if size > 0)
+        dependencies = sum(1 for mod in selected_mods if mod.get('is_dependency', False))
+        main_mods = len(selected_mods) - dependencies
 
-        for mod in selected_mods:
-
-            if mod.get('is_dependency', False):
-                dependencies += 1
-            else:
-                main_mods += 1
-
-            info = mod.get("info", {})
-            try:
-                file_size = int(info.get("file_size", 0))
-                if file_size > 0:
-                    total_size += file_size
-                    valid_size_count += 1
-            except (ValueError, TypeError):
-                pass
-
-        if total_size > 0:
-            total_size_mb = total_size / (1024 * 1024)
-            if total_size_mb >= 1024:
-                size_str = f"{total_size_mb / 1024:.2f} GB"
-            else:
-                size_str = f"{total_size_mb:.2f} MB"
-        else:
-            size_str = "Unknown"
+        size_str = _format_size(total_size) if total_size > 0 else "Unknown"
 
         text = f"Multiple mods selected: {len(selected_mods)} total\n"
 
@@ -371,11 +405,7 @@ class ModInfoWidget:
         info = mod.get("info", {})
 
         try:
-            size_mb = int(info.get("file_size", 0)) / (1024 * 1024)
-            if size_mb >= 1024:
-                size_str = f"{size_mb / 1024:.2f} GB"
-            else:
-                size_str = f"{size_mb:.2f} MB"
+            size_str = _format_size(int(info.get("file_size", 0)))
         except (ValueError, TypeError):
             size_str = "N/A"
 
@@ -385,23 +415,32 @@ class ModInfoWidget:
                 f"URL: {mod['url']}\n"
                 f"Size: {size_str}\n")
 
-        all_mods_by_id = {m['id']: m for m in all_mods}
         dependencies = info.get("dependencies", [])
         if dependencies:
-            dep_titles = [all_mods_by_id.get(dep_id, {}).get('info', {}).get('title', dep_id) for dep_id in
+            dep_titles = [self._id_index.get(dep_id, {}).get('info', {}).get('title', dep_id) for dep_id in
                           dependencies]
             text += f"\nRequires: {', '.join(dep_titles)}"
 
-        requiring_mods = []
-        for other_mod in all_mods:
-            if mod['id'] in other_mod.get('info', {}).get('dependencies', []):
-                requiring_mods.append(other_mod.get('info', {}).get('title', other_mod['id']))
+        requiring_mods = [other_mod.get('info', {}).get('title', other_mod['id'])
+                          for other_mod in self._required_by.get(mod['id'], ())]
 
         if requiring_mods:
             text += f"\nRequired by: {', '.join(requiring_mods)}"
 
         return text
 
+    def _index_mods(self, all_mods):
+        """Build the id and required-by lookups for an all_mods snapshot in one pass."""
+        id_index = {}
+        required_by = {}
+        for other_mod in all_mods:
+            id_index[other_mod['id']] = other_mod
+            for dep_id in other_mod['_index'].dep_set:
+                required_by.setdefault(dep_id, []).append(other_mod)
+        self._all_mods_ref = all_mods
+        self._id_index = id_index
+        self._required_by = required_by
+
     def _set_text(self, text):
         """Set the text in the info widget."""
         self.info_text.config(state=tk.NORMAL)